@@ -0,0 +1,166 @@
+"""Headless JSON API for eligibility checks.
+
+Serves the same rules as the quiz page from a small async (Starlette)
+app, with no Streamlit session per request.
+
+    python api.py --port 8000
+
+    POST /assess         one applicant, fields as on the quiz form
+    POST /assess/batch   {"applicants": [...]}, assessed in one vectorised pass
+    GET  /health         rules version currently loaded
+    GET  /metrics        Prometheus text (see ``metrics``)
+"""
+
+import argparse
+import sys
+
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.routing import Route
+
+from bulk import FIELDS, FLAG_FIELDS, assess_batch, batch_from_columns
+import metrics
+import submission_log
+from eligibility import MAX_HOUSEHOLD_SIZE, STATES, Applicant, Reason, cached_assess, get_rules
+
+MAX_BATCH = 10_000
+
+_FLAG_VALUES = {True: True, False: False, "Yes": True, "No": False}
+# Canonical code strings, so applicants share them rather than each
+# holding its own copy decoded from the request
+_STATE_CODES = {code: code for code in STATES}
+# Reason names for every bitmask, as returned in "reasons"
+_REASON_NAMES = [[reason.name for reason in Reason if bits & reason] for bits in range(1 << len(Reason))]
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def _flag(record, name):
+    try:
+        return _FLAG_VALUES[record[name]]
+    except (KeyError, TypeError):
+        raise BadRequest(f"{name}: expected true/false or \"Yes\"/\"No\"") from None
+
+
+def _number(record, name, minimum):
+    value = record[name]
+    # JSON parsing lets NaN, Infinity (also from 1e400) and huge integers through;
+    # NaN fails every comparison
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not minimum <= value <= sys.float_info.max:
+        raise BadRequest(f"{name}: expected a finite number of at least {minimum}")
+    return value
+
+
+def _household_size(record):
+    value = _number(record, "household_size", 1)
+    if value != int(value) or value > MAX_HOUSEHOLD_SIZE:
+        raise BadRequest(f"household_size: expected a whole number from 1 to {MAX_HOUSEHOLD_SIZE}")
+    return int(value)
+
+
+def applicant_from_json(record):
+    if not isinstance(record, dict):
+        raise BadRequest("expected a JSON object")
+    missing = [name for name in FIELDS if name not in record]
+    if missing:
+        raise BadRequest(f"missing fields: {', '.join(missing)}")
+    state = record["state"]
+    if not isinstance(state, str) or state not in _STATE_CODES:
+        raise BadRequest(f"state: expected one of {', '.join(STATES)}")
+    return Applicant(
+        state=_STATE_CODES[state],
+        household_size=_household_size(record),
+        income=float(_number(record, "income", 0)),
+        assets=float(_number(record, "assets", 0)),
+        **{name: _flag(record, name) for name in FLAG_FIELDS},
+    )
+
+
+async def _json_body(request):
+    try:
+        return await request.json()
+    except ValueError:
+        raise BadRequest("request body is not valid JSON") from None
+
+
+async def assess_one(request):
+    applicant = applicant_from_json(await _json_body(request))
+    with metrics.timer("api_evaluate"):
+        result = cached_assess(applicant)
+    metrics.record_assessment(applicant.state, result)
+    submission_log.record(applicant, result)
+    return JSONResponse({
+        "eligible": result.eligible,
+        "reasons": _REASON_NAMES[result.reasons],
+        "notes": list(result.notes),
+        "income_limit": result.income_limit,
+        "asset_limit": result.asset_limit,
+        "wait_estimate": result.wait_estimate,
+        "apply_link": result.apply_link,
+        "rules_version": result.rules_version,
+    })
+
+
+async def assess_many(request):
+    body = await _json_body(request)
+    records = body.get("applicants") if isinstance(body, dict) else None
+    if not isinstance(records, list):
+        raise BadRequest("expected {\"applicants\": [...]}")
+    if len(records) > MAX_BATCH:
+        return JSONResponse({"error": f"at most {MAX_BATCH} applicants per request"}, status_code=413)
+    applicants = [applicant_from_json(record) for record in records]
+    batch = batch_from_columns({name: [getattr(a, name) for a in applicants] for name in FIELDS})
+    with metrics.timer("api_evaluate_batch"):
+        result = assess_batch(batch)
+    metrics.record_batch(batch, result)
+    submission_log.record_batch(batch, result)
+    return JSONResponse({
+        "rules_version": result.rules_version,
+        "results": [
+            {"eligible": eligible, "reasons": _REASON_NAMES[reasons], "income_limit": income_limit,
+             "asset_limit": asset_limit, "wait_estimate": wait}
+            for eligible, reasons, income_limit, asset_limit, wait in zip(
+                result.eligible.tolist(), result.reasons.tolist(), result.income_limit.tolist(),
+                result.asset_limit.tolist(), result.wait_estimate.tolist())
+        ],
+    })
+
+
+async def health(request):
+    return JSONResponse({"status": "ok", "rules_version": get_rules().version})
+
+
+async def prometheus(request):
+    return PlainTextResponse(metrics.REGISTRY.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+
+async def bad_request(request, exc):
+    return JSONResponse({"error": str(exc)}, status_code=400)
+
+
+app = Starlette(
+    routes=[
+        Route("/assess", assess_one, methods=["POST"]),
+        Route("/assess/batch", assess_many, methods=["POST"]),
+        Route("/health", health),
+        Route("/metrics", prometheus),
+    ],
+    exception_handlers={BadRequest: bad_request},
+)
+
+
+def main(argv=None):
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve the eligibility rules over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args(argv)
+    get_rules()  # load and validate before accepting requests
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
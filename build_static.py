@@ -0,0 +1,176 @@
+"""Pre-render static result pages for every categorical answer combination.
+
+For each state, combination of the five Yes/No answers and household size,
+the rules are evaluated once here and written out as a JSON document and
+an HTML page with the limits embedded. The page's small script only has
+to compare the applicant's income and assets against those limits, so the
+pages can be served from a CDN without touching a Python process.
+
+    python build_static.py --out site
+
+Pages live at ``<state>/<household_size>/<answers>.html`` where
+``answers`` is one Y/N letter per question in form order: citizenship,
+state resident, owns property, independent income, priority. Income and
+assets go in the query string, e.g. ``NSW/2/YYNYN.html?income=900&assets=0``.
+"""
+
+import argparse
+import html
+import itertools
+import json
+from pathlib import Path
+
+from eligibility import FLAG_FIELDS, NOTE_TEMPLATES, STATES, TABLE_HOUSEHOLD_SIZE, Applicant, Reason, assess, get_rules
+
+PAGE = """<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Aussie Public Housing Eligibility Quiz - {state}</title>
+</head>
+<body>
+<h1>Aussie Public Housing Eligibility Quiz</h1>
+<p><em>Not official advice. Always verify with government sites.</em></p>
+<form id="money">
+<label>Weekly gross household income <input name="income" type="number" min="0" step="1" value="0"></label>
+<label>Total assessable assets <input name="assets" type="number" min="0" step="1" value="0"></label>
+</form>
+<h2>Assessment</h2>
+<p id="outcome"></p>
+<ul id="notes"></ul>
+<p>Estimated wait time in {state}: {wait_estimate} (varies by location and demand; check official reports).</p>
+<p><small>Assessed with rules version {rules_version}.</small></p>
+<details>
+<summary>Next Steps Without Red Tape</summary>
+<ol>
+<li>Gather docs: ID, income proof, Centrelink statements.</li>
+<li>Apply online: <a href="{apply_link}">{apply_link}</a></li>
+<li>For full national info: <a href="https://my.gov.au/en/services/living-arrangements/finding-renting-and-buying-a-home/help-with-homelessness/social-public-and-community-housing">my.gov.au</a></li>
+<li>If stuck, contact a housing support service like 1800 825 955 (national homelessness hotline).</li>
+</ol>
+</details>
+<script type="application/json" id="result">{payload}</script>
+<script>
+(function () {{
+  var r = JSON.parse(document.getElementById("result").textContent);
+  var form = document.getElementById("money");
+  var query = new URLSearchParams(location.search);
+  ["income", "assets"].forEach(function (name) {{
+    if (query.has(name)) form.elements[name].value = query.get(name);
+  }});
+  // An empty box is missing, not zero
+  function number(name) {{
+    var text = form.elements[name].value;
+    return text === "" ? NaN : Number(text);
+  }}
+  function render() {{
+    var income = number("income");
+    var assets = number("assets");
+    var list = document.getElementById("notes");
+    list.textContent = "";
+    if (!(isFinite(income) && income >= 0 && isFinite(assets) && assets >= 0)) {{
+      document.getElementById("outcome").textContent = "Enter income and assets as amounts of $0 or more.";
+      return;
+    }}
+    var notes = r.notes.slice();
+    var eligible = r.reasons === 0;
+    if (income > r.income_limit) {{ eligible = false; notes.push(r.income_note); }}
+    if (assets > r.asset_limit) {{ eligible = false; notes.push(r.asset_note); }}
+    document.getElementById("outcome").textContent = eligible
+      ? "Based on your answers, you may be eligible! Apply soon to join the waitlist."
+      : "You may not be eligible due to:";
+    if (!eligible) {{
+      notes.concat(r.priority_note ? [r.priority_note] : []).forEach(function (note) {{
+        var item = document.createElement("li");
+        item.textContent = note;
+        list.appendChild(item);
+      }});
+    }}
+  }}
+  form.addEventListener("input", render);
+  render();
+}})();
+</script>
+</body>
+</html>
+"""
+
+
+def answers_code(flags):
+    return "".join("Y" if flag else "N" for flag in flags)
+
+
+def result_document(rules, state, household_size, flags):
+    """Everything about a result that does not depend on income or assets."""
+    answers = dict(zip(FLAG_FIELDS, flags))
+    base = assess(Applicant(state=state, household_size=household_size, income=0, assets=0, **answers), rules)
+    fields = {"state": state, "household_size": household_size,
+              "income_limit": base.income_limit, "asset_limit": base.asset_limit}
+    notes = list(base.notes[:-1] if answers["priority"] else base.notes)
+    return {
+        "state": state,
+        "household_size": household_size,
+        "answers": answers,
+        "reasons": int(base.reasons),
+        "notes": notes,
+        "income_limit": base.income_limit,
+        "asset_limit": base.asset_limit,
+        "income_note": NOTE_TEMPLATES[Reason.INCOME].format(**fields),
+        "asset_note": NOTE_TEMPLATES[Reason.ASSETS].format(**fields),
+        "priority_note": base.notes[-1] if answers["priority"] else None,
+        "wait_estimate": base.wait_estimate,
+        "apply_link": base.apply_link,
+        "rules_version": rules.version,
+    }
+
+
+def render_page(document):
+    # "</" cannot appear inside the inline JSON or it would end the script tag
+    payload = json.dumps(document).replace("</", "<\\/")
+    return PAGE.format(
+        state=html.escape(document["state"]),
+        wait_estimate=html.escape(document["wait_estimate"]),
+        rules_version=html.escape(document["rules_version"]),
+        apply_link=html.escape(document["apply_link"]),
+        payload=payload,
+    )
+
+
+def build(out, max_household_size=TABLE_HOUSEHOLD_SIZE, rules=None):
+    rules = rules or get_rules()
+    out = Path(out)
+    pages = 0
+    for state in STATES:
+        for household_size in range(1, max_household_size + 1):
+            directory = out / state / str(household_size)
+            directory.mkdir(parents=True, exist_ok=True)
+            for flags in itertools.product((True, False), repeat=len(FLAG_FIELDS)):
+                document = result_document(rules, state, household_size, flags)
+                code = answers_code(flags)
+                (directory / f"{code}.json").write_text(json.dumps(document))
+                (directory / f"{code}.html").write_text(render_page(document))
+                pages += 1
+    manifest = {
+        "rules_version": rules.version,
+        "states": list(STATES),
+        "max_household_size": max_household_size,
+        "answers_order": list(FLAG_FIELDS),
+        "path": "{state}/{household_size}/{answers}.html",
+    }
+    (out / "index.json").write_text(json.dumps(manifest, indent=2))
+    return pages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-render static result pages.")
+    parser.add_argument("--out", default="site", help="output directory (default: %(default)s)")
+    parser.add_argument("--max-household-size", type=int, default=TABLE_HOUSEHOLD_SIZE,
+                        help="largest household size to render (default: %(default)s)")
+    args = parser.parse_args(argv)
+    pages = build(args.out, args.max_household_size)
+    print(f"{pages} result pages written to {args.out}/ (rules version {get_rules().version})")
+
+
+if __name__ == "__main__":
+    main()
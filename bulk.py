@@ -0,0 +1,299 @@
+"""Vectorised bulk assessment for caseworker uploads.
+
+Applicants are held column-wise in a :class:`Batch` of NumPy arrays and
+assessed with array operations against the same limit tables that
+``eligibility.assess`` uses, so there is no Python loop per row.
+"""
+
+import functools
+from dataclasses import dataclass
+
+import numpy as np
+
+from eligibility import FLAG_FIELDS, MAX_HOUSEHOLD_SIZE, STATES, TABLE_HOUSEHOLD_SIZE, Reason, get_rules
+
+FIELDS = ("state", "citizenship", "state_resident", "owns_property", "household_size",
+          "has_independent_income", "income", "assets", "priority")
+
+
+@dataclass(frozen=True)
+class CompiledRules:
+    """NumPy form of a :class:`eligibility.Rules`, indexed by state code."""
+
+    income_table: np.ndarray  # (state, household_size) for sizes 0..TABLE_HOUSEHOLD_SIZE
+    asset_table: np.ndarray
+    couple_income: np.ndarray  # closed-form tail for larger households
+    per_person_income: np.ndarray
+    large_assets: np.ndarray
+    requires_independent_income: np.ndarray
+    wait_labels: np.ndarray  # indexed by state * 2 + priority
+
+
+@functools.lru_cache(maxsize=8)
+def compile_rules(rules):
+    states = [rules.states[code] for code in STATES]
+    return CompiledRules(
+        income_table=np.array([[row[0] for row in rules.limit_tables[code]] for code in STATES], dtype=np.int64),
+        asset_table=np.array([[row[1] for row in rules.limit_tables[code]] for code in STATES], dtype=np.int64),
+        couple_income=np.array([state.income[1] for state in states], dtype=np.int64),
+        per_person_income=np.array([state.income[2] for state in states], dtype=np.int64),
+        large_assets=np.array([state.assets[2] for state in states], dtype=np.int64),
+        requires_independent_income=np.array([state.requires_independent_income for state in states]),
+        wait_labels=np.array([wait for state in states for wait in (state.general_wait, state.priority_wait)],
+                             dtype=object),
+    )
+
+
+_YES_NO = {"Yes": True, "No": False, "yes": True, "no": False, "true": True, "false": False,
+           "True": True, "False": False, "1": True, "0": False}
+
+
+@dataclass
+class Batch:
+    """Applicants stored column-wise; ``state`` holds indices into ``STATES``."""
+
+    state: np.ndarray
+    citizenship: np.ndarray
+    state_resident: np.ndarray
+    owns_property: np.ndarray
+    household_size: np.ndarray
+    has_independent_income: np.ndarray
+    income: np.ndarray
+    assets: np.ndarray
+    priority: np.ndarray
+
+    def __len__(self):
+        return len(self.state)
+
+
+@dataclass
+class BulkResult:
+    eligible: np.ndarray
+    reasons: np.ndarray
+    income_limit: np.ndarray
+    asset_limit: np.ndarray
+    wait_estimate: np.ndarray
+    rules_version: str
+
+    def __len__(self):
+        return len(self.eligible)
+
+
+class InvalidValue(ValueError):
+    """A value in an input column that cannot be assessed. ``row`` counts
+    from 0 within the batch."""
+
+    def __init__(self, field, row, value):
+        super().__init__(field, row, value)
+        self.field, self.row, self.value = field, row, value
+
+    def __str__(self):
+        return f"Invalid {self.field} in row {self.row + 1}: {self.value!r}"
+
+
+def _check(values, bad, field):
+    if bad.any():
+        row = int(np.flatnonzero(bad)[0])
+        raise InvalidValue(field, row, values[row:row + 1].tolist()[0])
+
+
+def _encode(values, vocabulary, field):
+    """Map an array of labels through ``vocabulary``, one lookup per distinct label."""
+    values = np.asarray(values)
+    try:
+        uniques, inverse = np.unique(values, return_inverse=True)
+    except TypeError:
+        # Labels of mixed types, such as a null among strings
+        _check(values, np.array([value not in vocabulary for value in values.tolist()]), field)
+        raise
+    inverse = inverse.reshape(-1)
+    labels = uniques.tolist()
+    _check(values, np.array([label not in vocabulary for label in labels])[inverse], field)
+    return np.array([vocabulary[label] for label in labels])[inverse]
+
+
+def _flags(values, field):
+    values = np.asarray(values)
+    if values.dtype == np.bool_:
+        return values
+    if values.dtype.kind in "iuf":
+        _check(values, (values != 0) & (values != 1), field)
+        return values != 0
+    return _encode(values, _YES_NO, field).astype(np.bool_)
+
+
+def _numbers(values, field):
+    """A column as float64; missing (null) entries become NaN."""
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f"Column {field!r} must hold numbers") from None
+
+
+def batch_from_columns(columns):
+    """Build a :class:`Batch` from a mapping of form field name to column.
+
+    State columns may hold codes ("NSW", ...) or indices into ``STATES``;
+    Yes/No columns may hold "Yes"/"No" strings, booleans or 0/1. Missing,
+    non-finite or out-of-range values raise :class:`InvalidValue` rather
+    than being assessed.
+    """
+    missing = [name for name in FIELDS if name not in columns]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+    state = np.asarray(columns["state"])
+    if state.dtype.kind in "iu":
+        _check(state, (state < 0) | (state >= len(STATES)), "state")
+    else:
+        state = _encode(state, {code: i for i, code in enumerate(STATES)}, "state")
+    household_size = _numbers(columns["household_size"], "household_size")
+    _check(household_size, ~np.isfinite(household_size) | (household_size < 1)
+           | (household_size > MAX_HOUSEHOLD_SIZE) | (household_size != np.floor(household_size)), "household_size")
+    amounts = {name: _numbers(columns[name], name) for name in ("income", "assets")}
+    for name, values in amounts.items():
+        _check(values, ~np.isfinite(values) | (values < 0), name)
+
+    return Batch(
+        state=state.astype(np.int8),
+        household_size=household_size.astype(np.int64),
+        **amounts,
+        **{name: _flags(columns[name], name) for name in FLAG_FIELDS},
+    )
+
+
+def limits_for(state, household_size, rules=None):
+    """Vectorised ``eligibility.limits``: arrays of income and asset limits."""
+    compiled = compile_rules(rules or get_rules())
+    state = state.astype(np.intp)
+    tabled = household_size <= TABLE_HOUSEHOLD_SIZE
+    column = np.minimum(household_size, TABLE_HOUSEHOLD_SIZE)
+    income_limit = compiled.income_table[state, column]
+    asset_limit = compiled.asset_table[state, column]
+    if not tabled.all():
+        tail = ~tabled
+        tail_state = state[tail]
+        income_limit[tail] = (compiled.couple_income[tail_state]
+                              + (household_size[tail] - 2) * compiled.per_person_income[tail_state])
+        asset_limit[tail] = compiled.large_assets[tail_state]
+    return income_limit, asset_limit
+
+
+def assess_batch(batch, rules=None):
+    """Assess every applicant in ``batch`` and return a :class:`BulkResult`.
+
+    Uses the process-wide rules unless ``rules`` is given.
+    """
+    rules = rules or get_rules()
+    compiled = compile_rules(rules)
+    income_limit, asset_limit = limits_for(batch.state, batch.household_size, rules)
+
+    # Citizenship, residency and property ownership are checked in order;
+    # only the first failure is reported, as on the quiz page.
+    not_citizen = ~batch.citizenship
+    not_resident = batch.citizenship & ~batch.state_resident
+    owns_property = batch.citizenship & batch.state_resident & batch.owns_property
+    no_independent_income = compiled.requires_independent_income[batch.state] & ~batch.has_independent_income
+
+    reasons = not_citizen.astype(np.uint8)
+    reasons |= not_resident.astype(np.uint8) << 1
+    reasons |= owns_property.astype(np.uint8) << 2
+    reasons |= no_independent_income.astype(np.uint8) << 3
+    reasons |= (batch.income > income_limit).astype(np.uint8) << 4
+    reasons |= (batch.assets > asset_limit).astype(np.uint8) << 5
+
+    return BulkResult(
+        eligible=reasons == 0,
+        reasons=reasons,
+        income_limit=income_limit,
+        asset_limit=asset_limit,
+        wait_estimate=compiled.wait_labels[batch.state.astype(np.intp) * 2 + batch.priority],
+        rules_version=rules.version,
+    )
+
+
+def compare_states(applicant, rules=None):
+    """Assess one :class:`eligibility.Applicant` against every state's rules
+    in a single pass, as if they lived there (residency counts as met).
+
+    Returns output columns with eligible states first, then the most
+    income headroom.
+    """
+    rules = rules or get_rules()
+    n_states = len(STATES)
+    batch = Batch(
+        state=np.arange(n_states, dtype=np.int8),
+        citizenship=np.full(n_states, bool(applicant.citizenship)),
+        state_resident=np.ones(n_states, dtype=np.bool_),
+        owns_property=np.full(n_states, bool(applicant.owns_property)),
+        household_size=np.full(n_states, int(applicant.household_size), dtype=np.int64),
+        has_independent_income=np.full(n_states, bool(applicant.has_independent_income)),
+        income=np.full(n_states, float(applicant.income)),
+        assets=np.full(n_states, float(applicant.assets)),
+        priority=np.full(n_states, bool(applicant.priority)),
+    )
+    result = assess_batch(batch, rules)
+    income_headroom = result.income_limit - batch.income
+    order = np.lexsort((-income_headroom, ~result.eligible))
+    waits = compile_rules(rules).wait_labels
+    return {
+        "state": np.array(STATES, dtype=object)[order],
+        "eligible": result.eligible[order],
+        "reasons": np.array([reason_labels(r) for r in result.reasons[order].tolist()], dtype=object),
+        "income_headroom": income_headroom[order],
+        "asset_headroom": (result.asset_limit - batch.assets)[order],
+        "general_wait": waits[order * 2],
+        "priority_wait": waits[order * 2 + 1],
+    }
+
+
+def reason_labels(reasons):
+    """Render a reason bitmask as ``"INCOME|ASSETS"`` ("" when eligible)."""
+    return "|".join(reason.name for reason in Reason if reasons & reason)
+
+
+def _arrow_column(column, vocabulary, field):
+    """Convert a pyarrow column, encoding labels with a hash lookup."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if isinstance(column, pa.Array):
+        column = pa.chunked_array([column])
+    if column.null_count:
+        raise InvalidValue(field, pc.index(pc.is_null(column), True).as_py(), None)
+    if not (pa.types.is_string(column.type) or pa.types.is_large_string(column.type)):
+        return column.to_numpy()
+    codes = pc.index_in(column, value_set=pa.array(list(vocabulary)))
+    if codes.null_count:
+        row = pc.index(pc.is_null(codes), True).as_py()
+        raise InvalidValue(field, row, column[row].as_py())
+    return np.array(list(vocabulary.values()))[codes.to_numpy()]
+
+
+def batch_from_arrow(data):
+    """Build a :class:`Batch` from a pyarrow ``Table`` or ``RecordBatch``."""
+    vocabularies = dict.fromkeys(FLAG_FIELDS, _YES_NO)
+    vocabularies["state"] = {code: i for i, code in enumerate(STATES)}
+    return batch_from_columns({
+        name: _arrow_column(data.column(name), vocabularies.get(name, {}), name)
+        for name in FIELDS if name in data.column_names
+    })
+
+
+def read_csv(source):
+    """Read a CSV with a header row of ``FIELDS`` into a :class:`Batch`."""
+    import pyarrow.csv as pacsv
+
+    return batch_from_arrow(pacsv.read_csv(source))
+
+
+def result_columns(result):
+    """Output columns for a :class:`BulkResult`, in file order."""
+    return {
+        "eligible": result.eligible,
+        "reasons": result.reasons,
+        "income_limit": result.income_limit,
+        "asset_limit": result.asset_limit,
+        "wait_estimate": result.wait_estimate,
+        "rules_version": np.full(len(result), result.rules_version, dtype=object),
+    }
@@ -0,0 +1,232 @@
+"""Command-line assessor for large applicant files.
+
+Reads applicants as CSV, JSON Lines or Parquet from a file (CSV and JSON
+Lines also from stdin) in fixed-size chunks, assesses each chunk with the
+vectorised rules in ``bulk`` and streams the results out, so memory use
+does not grow with the input.
+
+    python cli.py applicants.csv > assessments.csv
+    cat applicants.jsonl | python cli.py --format jsonl --output-format csv
+    python cli.py --workers 8 waitlist.csv -o assessments.csv
+"""
+
+import argparse
+import collections
+import io
+import itertools
+import json
+import sys
+import time
+
+from bulk import FIELDS, InvalidValue, assess_batch, batch_from_arrow, batch_from_columns, result_columns
+
+FORMATS = ("csv", "jsonl")
+INPUT_FORMATS = FORMATS + ("parquet",)
+# CSV is split into byte ranges; this converts --chunk-size to a range size
+CSV_BYTES_PER_ROW = 64
+CSV_MIN_CHUNK_BYTES = 1 << 16
+
+
+def iter_csv_chunks(source, chunk_size):
+    # Chunks stay raw bytes, each with the header line, so that parsing
+    # happens wherever they are assessed. They are cut at line ends, so
+    # quoted fields must not contain newlines.
+    header = source.readline()
+    block_size = max(chunk_size * CSV_BYTES_PER_ROW, CSV_MIN_CHUNK_BYTES)
+    while True:
+        chunk = source.read(block_size)
+        if not chunk:
+            return
+        if not chunk.endswith(b"\n"):
+            chunk += source.readline()
+        if chunk.strip():
+            yield header + chunk
+
+
+def parse_csv(chunk):
+    import pyarrow.csv as pacsv
+
+    return batch_from_arrow(pacsv.read_csv(io.BytesIO(chunk)))
+
+
+def iter_parquet_chunks(source, chunk_size):
+    import pyarrow.parquet as pq
+
+    for record_batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_size):
+        if record_batch.num_rows:
+            yield batch_from_arrow(record_batch)
+
+
+def iter_jsonl_chunks(source, chunk_size):
+    # Chunks stay raw bytes so that parsing happens wherever they are assessed
+    lines = (line for line in source if line.strip())
+    while True:
+        chunk = b"".join(itertools.islice(lines, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def parse_jsonl(chunk):
+    records = [json.loads(line) for line in chunk.splitlines()]
+    for row, record in enumerate(records):
+        if not isinstance(record, dict):
+            raise InvalidValue("JSON object", row, record)
+    try:
+        return batch_from_columns({name: [record[name] for record in records] for name in FIELDS})
+    except KeyError as exc:
+        raise ValueError(f"Missing field {exc.args[0]!r} in JSON Lines input") from None
+
+
+def encode_csv(result, header):
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    out = io.BytesIO()
+    pacsv.write_csv(pa.table(result_columns(result)), out, pacsv.WriteOptions(include_header=header))
+    return out.getvalue()
+
+
+def encode_jsonl(result, header):
+    columns = result_columns(result)
+    names = list(columns)
+    rows = zip(*(column.tolist() for column in columns.values()))
+    return "".join(json.dumps(dict(zip(names, row))) + "\n" for row in rows).encode()
+
+
+ENCODERS = {"csv": encode_csv, "jsonl": encode_jsonl}
+
+
+PARSERS = {"csv": parse_csv, "jsonl": parse_jsonl}
+
+
+def parse_chunk(chunk, fmt):
+    """A chunk from :func:`iter_chunks` as a :class:`bulk.Batch`."""
+    return PARSERS[fmt](chunk) if isinstance(chunk, bytes) else chunk
+
+
+def assess_chunk(chunk, fmt, output_format, header):
+    """Assess one chunk and return ``(encoded output, rows, eligible)``."""
+    batch = parse_chunk(chunk, fmt)
+    result = assess_batch(batch)
+    return ENCODERS[output_format](result, header), len(result), int(result.eligible.sum())
+
+
+def detect_format(path):
+    if path and path.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    if path and path.endswith(".parquet"):
+        return "parquet"
+    return "csv"
+
+
+def open_input(path):
+    if path in (None, "-"):
+        return sys.stdin.buffer
+    return open(path, "rb")
+
+
+def iter_chunks(source, fmt, chunk_size):
+    if fmt == "csv":
+        return iter_csv_chunks(source, chunk_size)
+    if fmt == "parquet":
+        return iter_parquet_chunks(source, chunk_size)
+    return iter_jsonl_chunks(source, chunk_size)
+
+
+def assess_serial(chunks, fmt, output_format):
+    for i, chunk in enumerate(chunks):
+        yield assess_chunk(chunk, fmt, output_format, i == 0)
+
+
+def assess_parallel(chunks, fmt, output_format, workers):
+    """Assess chunks on a process pool, yielding results in input order.
+
+    Workers receive raw CSV or JSON Lines bytes (Parquet as columnar
+    batches) and parse them themselves, never per-row objects. At most
+    ``2 * workers`` chunks are in flight, so memory stays bounded however
+    long the input is.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    pending = collections.deque()
+    chunks = iter(chunks)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        try:
+            for i in itertools.count():
+                try:
+                    chunk = next(chunks, None)
+                except ValueError:
+                    # A Parquet chunk failed to parse here; finish the ones before it first
+                    while pending:
+                        yield pending.popleft().result()
+                    raise
+                if chunk is None:
+                    break
+                pending.append(pool.submit(assess_chunk, chunk, fmt, output_format, i == 0))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # After a failed chunk nothing later is written, so skip the work
+            for future in pending:
+                future.cancel()
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Assess applicants from a CSV, JSON Lines or Parquet file.")
+    parser.add_argument("input", nargs="?", help="input file (default: stdin)")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument("--format", choices=INPUT_FORMATS,
+                        help="input format (default: from the file extension, else csv)")
+    parser.add_argument("--output-format", choices=FORMATS,
+                        help="output format (default: same as input, csv for Parquet input)")
+    parser.add_argument("--chunk-size", type=int, default=65536,
+                        help="rows per chunk; CSV is read in byte ranges of about this many rows, "
+                             f"at least {CSV_MIN_CHUNK_BYTES >> 10} KiB (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (default: %(default)s)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    fmt = args.format or detect_format(args.input)
+    output_format = args.output_format or (fmt if fmt in FORMATS else "csv")
+
+    start = time.perf_counter()
+    rows = eligible = 0
+    source = open_input(args.input)
+    sink = open(args.output, "wb") if args.output else sys.stdout.buffer
+    chunks = iter_chunks(source, fmt, args.chunk_size)
+    if args.workers > 1:
+        results = assess_parallel(chunks, fmt, output_format, args.workers)
+    else:
+        results = assess_serial(chunks, fmt, output_format)
+    try:
+        for encoded, chunk_rows, chunk_eligible in results:
+            sink.write(encoded)
+            rows += chunk_rows
+            eligible += chunk_eligible
+    except InvalidValue as exc:
+        # Rows are counted within a chunk; every earlier chunk was written out
+        print(f"error: {InvalidValue(exc.field, rows + exc.row, exc.value)}", file=sys.stderr)
+        return 1
+    except ValueError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        sink.flush()
+        if args.output:
+            sink.close()
+        if args.input not in (None, "-"):
+            source.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"{rows} applicants assessed, {eligible} may be eligible "
+          f"({elapsed:.2f}s, {rows / elapsed:,.0f} rows/s, {args.workers} worker(s))", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+"""Generate a browser-side copy of the eligibility rules.
+
+The rules file stays the single source of truth: :func:`generate_js`
+writes its limits, wait times, links and note wording into a small
+dependency-free JavaScript module that mirrors :func:`eligibility.assess`.
+:func:`component_html` wraps it in a self-contained form for
+``st.iframe``, so at peak load the quiz can be answered
+entirely in the browser. ``tools/check_client_parity.py`` checks the
+generated code against the Python rules.
+
+    python client_bundle.py --out eligibility.js
+"""
+
+import argparse
+import functools
+import html
+import json
+
+from eligibility import FLAG_FIELDS, MAX_HOUSEHOLD_SIZE, NOTE_TEMPLATES, PRIORITY_NOTE, STATES, get_rules
+
+BUNDLE = """\
+// Generated by client_bundle.py from rules version {version}. Do not edit.
+var HousingRules = (function () {{
+  "use strict";
+  var VERSION = {version_json};
+  var STATES = {states_json};
+  var NOTES = {notes_json};
+  var PRIORITY_NOTE = {priority_note_json};
+  var MAX_HOUSEHOLD_SIZE = {max_household_size};
+  var FLAGS = {flags_json};
+
+  function incomeLimit(rules, size) {{
+    if (size === 1) return rules.income[0];
+    if (size === 2) return rules.income[1];
+    return rules.income[1] + (size - 2) * rules.income[2];
+  }}
+
+  function assetLimit(rules, size) {{
+    if (size === 1) return rules.assets[0];
+    if (size === 2) return rules.assets[1];
+    return rules.assets[2];
+  }}
+
+  function format(template, fields) {{
+    return template.replace(/\\{{(\\w+)\\}}/g, function (_, name) {{ return String(fields[name]); }});
+  }}
+
+  function invalid(name, value) {{
+    return new Error("Invalid " + name + ": " + String(value));
+  }}
+
+  // The same answers eligibility.check_applicant rejects
+  function check(a) {{
+    if (typeof a.state !== "string" || !Object.prototype.hasOwnProperty.call(STATES, a.state)) {{
+      throw invalid("state", a.state);
+    }}
+    FLAGS.forEach(function (name) {{
+      var value = a[name];
+      if (value !== true && value !== false && value !== 0 && value !== 1) throw invalid(name, value);
+    }});
+    var size = a.household_size;
+    if (!Number.isInteger(size) || size < 1 || size > MAX_HOUSEHOLD_SIZE) throw invalid("household_size", size);
+    ["income", "assets"].forEach(function (name) {{
+      var value = a[name];
+      if (typeof value !== "number" || !isFinite(value) || value < 0) throw invalid(name, value);
+    }});
+  }}
+
+  // a: {{state, citizenship, state_resident, owns_property, household_size,
+  //      has_independent_income, income, assets, priority}}; Yes/No as booleans.
+  // Throws an Error naming the field for answers that cannot be assessed.
+  function assess(a) {{
+    check(a);
+    var rules = STATES[a.state];
+    var size = a.household_size;
+    var fields = {{state: a.state, household_size: size,
+                  income_limit: incomeLimit(rules, size), asset_limit: assetLimit(rules, size)}};
+    var reasons = 0;
+    if (!a.citizenship) reasons |= 1;
+    else if (!a.state_resident) reasons |= 2;
+    else if (a.owns_property) reasons |= 4;
+    if (rules.requires_independent_income && !a.has_independent_income) reasons |= 8;
+    if (a.income > fields.income_limit) reasons |= 16;
+    if (a.assets > fields.asset_limit) reasons |= 32;
+
+    var notes = [];
+    NOTES.forEach(function (note) {{
+      if (reasons & note[0]) notes.push(format(note[1], fields));
+    }});
+    if (a.priority) notes.push(PRIORITY_NOTE);
+
+    return {{
+      eligible: reasons === 0,
+      reasons: reasons,
+      notes: notes,
+      income_limit: fields.income_limit,
+      asset_limit: fields.asset_limit,
+      wait_estimate: a.priority ? rules.priority_wait : rules.general_wait,
+      apply_link: rules.apply_link,
+      rules_version: VERSION
+    }};
+  }}
+
+  return {{assess: assess, version: VERSION, states: Object.keys(STATES)}};
+}})();
+if (typeof module !== "undefined") module.exports = HousingRules;
+"""
+
+COMPONENT = """\
+<form id="quiz" style="font-family: sans-serif">
+<p><label>Which state/territory are you applying in?
+<select name="state">{state_options}</select></label></p>
+{questions}
+<p><label>How many people in your household (including yourself)?
+<input name="household_size" type="number" min="1" step="1" value="1"></label></p>
+<p><label>What's your household's total weekly gross income?
+<input name="income" type="number" min="0" step="1" value="0"></label></p>
+<p><label>What's your household's total assessable assets?
+<input name="assets" type="number" min="0" step="1" value="0"></label></p>
+</form>
+<div id="result" style="font-family: sans-serif"></div>
+<script>{bundle}</script>
+<script>
+(function () {{
+  var form = document.getElementById("quiz");
+  var out = document.getElementById("result");
+  function yes(name) {{ return form.elements[name].value === "Yes"; }}
+  // An empty box is missing, not zero
+  function number(name) {{
+    var text = form.elements[name].value;
+    return text === "" ? NaN : Number(text);
+  }}
+  function render() {{
+    var r;
+    out.textContent = "";
+    try {{
+      r = HousingRules.assess({{
+        state: form.elements.state.value,
+        citizenship: yes("citizenship"),
+        state_resident: yes("state_resident"),
+        owns_property: yes("owns_property"),
+        household_size: number("household_size"),
+        has_independent_income: yes("has_independent_income"),
+        income: number("income"),
+        assets: number("assets"),
+        priority: yes("priority")
+      }});
+    }} catch (error) {{
+      out.textContent = "Please check your answers (" + error.message + ").";
+      return;
+    }}
+    var head = document.createElement("p");
+    head.textContent = r.eligible
+      ? "Based on your answers, you may be eligible! Apply soon to join the waitlist."
+      : "You may not be eligible due to:";
+    out.appendChild(head);
+    if (!r.eligible) {{
+      var list = document.createElement("ul");
+      r.notes.forEach(function (note) {{
+        var item = document.createElement("li");
+        item.textContent = note;
+        list.appendChild(item);
+      }});
+      out.appendChild(list);
+    }}
+    var wait = document.createElement("p");
+    wait.textContent = "Estimated wait time in " + form.elements.state.value + ": " + r.wait_estimate +
+      " (varies by location and demand; check official reports). Apply online: " + r.apply_link;
+    out.appendChild(wait);
+  }}
+  form.addEventListener("input", render);
+  render();
+}})();
+</script>
+"""
+
+QUESTIONS = (
+    ("citizenship", "Are you an Australian citizen or permanent resident?"),
+    ("state_resident", "Are you a resident of the state/territory you picked?"),
+    ("owns_property", "Do you own or partly own any property in Australia?"),
+    ("has_independent_income", "Does at least one household member have an independent income?"),
+    ("priority", "Do you have priority needs? (e.g., homelessness, disability, domestic violence)"),
+)
+
+
+def _json(value):
+    # Safe to inline in a <script> tag
+    return json.dumps(value).replace("</", "<\\/")
+
+
+@functools.lru_cache(maxsize=4)
+def generate_js(rules):
+    """The JavaScript module for one :class:`eligibility.Rules` version."""
+    states = {
+        code: {
+            "income": list(state.income),
+            "assets": list(state.assets),
+            "requires_independent_income": state.requires_independent_income,
+            "priority_wait": state.priority_wait,
+            "general_wait": state.general_wait,
+            "apply_link": state.apply_link,
+        }
+        for code, state in rules.states.items()
+    }
+    return BUNDLE.format(
+        version=rules.version,
+        version_json=_json(rules.version),
+        states_json=_json(states),
+        notes_json=_json([[int(reason), template] for reason, template in NOTE_TEMPLATES.items()]),
+        priority_note_json=_json(PRIORITY_NOTE),
+        max_household_size=MAX_HOUSEHOLD_SIZE,
+        flags_json=_json(FLAG_FIELDS),
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def component_html(rules):
+    """A self-contained quiz form that assesses in the browser."""
+    questions = "\n".join(
+        f'<p><label>{html.escape(label)} <select name="{name}"><option>Yes</option><option>No</option>'
+        f"</select></label></p>"
+        for name, label in QUESTIONS
+    )
+    return COMPONENT.format(
+        state_options="".join(f"<option>{code}</option>" for code in STATES),
+        questions=questions,
+        bundle=generate_js(rules),
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write the client-side rules bundle.")
+    parser.add_argument("--out", default="eligibility.js", help="output path (default: %(default)s)")
+    args = parser.parse_args(argv)
+    rules = get_rules()
+    with open(args.out, "w") as f:
+        f.write(generate_js(rules))
+    print(f"Wrote {args.out} (rules version {rules.version})")
+
+
+if __name__ == "__main__":
+    main()
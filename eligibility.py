@@ -0,0 +1,593 @@
+"""Eligibility rules for the housing quiz.
+
+Pure Python with no Streamlit dependency, so the same rules can be used
+from the Streamlit page, batch jobs and benchmarks. Thresholds, wait times
+and links live in a versioned rules file (``rules/<year>.toml``) that is
+parsed and validated once per process and reloaded when the file changes;
+see :func:`get_rules`. For fast cold starts the parsed rules can be
+precompiled next to the file:
+
+    python eligibility.py --compile
+"""
+
+import argparse
+import functools
+import json
+import logging
+import math
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import IntFlag
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Canonical order of states/territories; numeric state codes index this.
+STATES = ("NSW", "VIC", "QLD", "SA", "WA", "TAS", "NT", "ACT")
+
+RULES_DIR = Path(__file__).resolve().parent / "rules"
+DEFAULT_RULES_PATH = RULES_DIR / "2025.toml"
+RULES_PATH_ENV = "HOUSING_QUIZ_RULES"
+# How often (seconds) the rules file is checked for changes
+RULES_CHECK_INTERVAL = 2.0
+# Bump when the compiled artifact's layout changes so old ones are ignored
+COMPILED_FORMAT = 2
+# Distinct normalised answers kept by cached_assess()
+ASSESSMENT_CACHE_SIZE = 4096
+
+# Household sizes covered by the precomputed limit tables; larger households
+# fall back to the closed-form tail.
+TABLE_HOUSEHOLD_SIZE = 16
+# Largest household size accepted from uploads and the API
+MAX_HOUSEHOLD_SIZE = 100
+
+
+class RulesError(ValueError):
+    """A rules file is missing data or has values of the wrong shape."""
+
+
+@dataclass(frozen=True, eq=False)
+class StateRules:
+    """Rules for one state. ``income`` is the weekly limit for one and two
+    people plus the increment per extra person; ``assets`` is the limit for
+    one, two and three or more people."""
+
+    income: tuple
+    assets: tuple
+    priority_wait: str
+    general_wait: str
+    apply_link: str
+    requires_independent_income: bool = False
+
+    def income_limit(self, household_size):
+        single, couple, per_person = self.income
+        if household_size == 1:
+            return single
+        if household_size == 2:
+            return couple
+        return couple + (household_size - 2) * per_person
+
+    def asset_limit(self, household_size):
+        single, couple, larger = self.assets
+        if household_size == 1:
+            return single
+        if household_size == 2:
+            return couple
+        return larger
+
+
+@dataclass(frozen=True, eq=False)
+class Rules:
+    """One validated version of the rules, with its limit tables compiled.
+
+    Treat as read-only: a single instance is shared by every session.
+    """
+
+    version: str
+    year: int
+    states: dict
+    limit_tables: dict = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Index 0 is never read (household sizes start at 1) but keeps the
+        # tables indexable directly by household size.
+        tables = {
+            code: tuple(
+                (state.income_limit(size), state.asset_limit(size))
+                for size in range(TABLE_HOUSEHOLD_SIZE + 1)
+            )
+            for code, state in self.states.items()
+        }
+        object.__setattr__(self, "limit_tables", tables)
+
+    def limits(self, state, household_size):
+        """Return ``(income_limit, asset_limit)`` for a state and household size.
+
+        Income limits are weekly gross; asset limits exclude super.
+        """
+        try:
+            table = self.limit_tables[state]
+        except KeyError:
+            raise ValueError(f"Unknown state/territory: {state!r}") from None
+        if 1 <= household_size <= TABLE_HOUSEHOLD_SIZE:
+            return table[household_size]
+        rules = self.states[state]
+        return rules.income_limit(household_size), rules.asset_limit(household_size)
+
+
+def _limit_triple(value, where):
+    if (not isinstance(value, list) or len(value) != 3
+            or not all(isinstance(v, int) and not isinstance(v, bool) and v >= 0 for v in value)):
+        raise RulesError(f"{where}: expected a list of three non-negative integers, got {value!r}")
+    return tuple(value)
+
+
+def _text(value, where):
+    if not isinstance(value, str) or not value:
+        raise RulesError(f"{where}: expected a non-empty string, got {value!r}")
+    return value
+
+
+def parse_rules(data, source="rules"):
+    """Validate a decoded rules document and return a :class:`Rules`."""
+    version = _text(data.get("version"), f"{source}: version")
+    year = data.get("year")
+    if not isinstance(year, int) or isinstance(year, bool):
+        raise RulesError(f"{source}: year: expected an integer, got {year!r}")
+
+    states = data.get("states", {})
+    missing = [code for code in STATES if code not in states]
+    unknown = [code for code in states if code not in STATES]
+    if missing or unknown:
+        raise RulesError(f"{source}: states missing {missing or '[]'}, unknown {unknown or '[]'}")
+
+    parsed = {}
+    for code in STATES:
+        entry = dict(states[code])
+        where = f"{source}: states.{code}"
+        requires_independent_income = entry.pop("requires_independent_income", False)
+        if not isinstance(requires_independent_income, bool):
+            raise RulesError(f"{where}.requires_independent_income: expected true or false")
+        parsed[code] = StateRules(
+            income=_limit_triple(entry.pop("income", None), f"{where}.income"),
+            assets=_limit_triple(entry.pop("assets", None), f"{where}.assets"),
+            priority_wait=_text(entry.pop("priority_wait", None), f"{where}.priority_wait"),
+            general_wait=_text(entry.pop("general_wait", None), f"{where}.general_wait"),
+            apply_link=_text(entry.pop("apply_link", None), f"{where}.apply_link"),
+            requires_independent_income=requires_independent_income,
+        )
+        if entry:
+            raise RulesError(f"{where}: unknown keys {sorted(entry)}")
+
+    return Rules(version=version, year=year, states=parsed)
+
+
+def rules_path(path=None):
+    """Resolve a rules file: ``path``, else ``$HOUSING_QUIZ_RULES``, else
+    ``rules/2025.toml``."""
+    return Path(path or os.environ.get(RULES_PATH_ENV) or DEFAULT_RULES_PATH)
+
+
+def compiled_path(path=None):
+    """Where the precompiled form of a rules file lives."""
+    return rules_path(path).with_suffix(".compiled")
+
+
+def _load_compiled(path, source):
+    # The artifact is plain JSON of the decoded document, never code: the
+    # Rules object and its tables are rebuilt and revalidated here.
+    try:
+        with open(compiled_path(path), "rb") as f:
+            artifact = json.load(f)
+        if artifact.get("format") != COMPILED_FORMAT or artifact.get("source") != source.decode():
+            return None
+        return parse_rules(artifact["document"], source=str(path))
+    except FileNotFoundError:
+        return None
+    except Exception as exc:  # stale or corrupt: fall back to the rules file
+        logger.warning("Ignoring %s: %s", compiled_path(path), exc)
+        return None
+
+
+def load_rules(path=None):
+    """Load and validate a rules file (see :func:`rules_path`).
+
+    Uses the precompiled artifact (see :func:`compile_rules_file`) when it
+    was built from exactly this file's contents.
+    """
+    path = rules_path(path)
+    with open(path, "rb") as f:
+        source = f.read()
+    return _load_compiled(path, source) or _parse_source(path, source)
+
+
+def _decode_source(path, source):
+    import tomllib  # only needed when there is no usable artifact
+
+    try:
+        return tomllib.loads(source.decode())
+    except (tomllib.TOMLDecodeError, UnicodeDecodeError) as exc:
+        raise RulesError(f"{path}: {exc}") from None
+
+
+def _parse_source(path, source):
+    return parse_rules(_decode_source(path, source), source=str(path))
+
+
+def compile_rules_file(path=None):
+    """Validate a rules file and write its decoded form beside it as JSON,
+    so processes can skip the TOML parser on start-up."""
+    path = rules_path(path)
+    with open(path, "rb") as f:
+        source = f.read()
+    document = _decode_source(path, source)
+    rules = parse_rules(document, source=str(path))
+    target = compiled_path(path)
+    tmp = target.with_name(target.name + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump({"format": COMPILED_FORMAT, "source": source.decode(), "document": document}, f)
+    os.replace(tmp, target)
+    return target, rules
+
+
+class RulesStore:
+    """Holds the current :class:`Rules` and swaps in a new version when the
+    rules file changes.
+
+    The file is stat'ed at most every ``check_interval`` seconds. A changed
+    file is parsed and validated in full before it replaces the current
+    rules; if it fails validation the current rules stay in place. Callers
+    take one :class:`Rules` per assessment, so an assessment that is already
+    running finishes on the version it started with.
+    """
+
+    def __init__(self, path=None, check_interval=RULES_CHECK_INTERVAL):
+        self.path = rules_path(path)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._rules = None
+        self._file_key = None
+        self._next_check = 0.0
+
+    def get(self):
+        if self._rules is None or time.monotonic() >= self._next_check:
+            self._refresh()
+        return self._rules
+
+    def _refresh(self):
+        with self._lock:
+            now = time.monotonic()
+            if self._rules is not None and now < self._next_check:
+                return  # another thread checked while we waited
+            self._next_check = now + self.check_interval
+            try:
+                stat = os.stat(self.path)
+                file_key = (stat.st_mtime_ns, stat.st_size)
+                if self._rules is not None and file_key == self._file_key:
+                    return
+                # Remember the file even if it turns out to be invalid, so a
+                # bad edit is reported once rather than on every check.
+                self._file_key = file_key
+                rules = load_rules(self.path)
+            except (OSError, RulesError) as exc:
+                if self._rules is None:
+                    raise
+                logger.warning("Keeping rules version %s; could not reload %s: %s",
+                               self._rules.version, self.path, exc)
+                return
+            if self._rules is not None:
+                logger.info("Rules reloaded from %s: version %s -> %s",
+                            self.path, self._rules.version, rules.version)
+            self._rules = rules
+
+
+_store = None
+
+
+def get_rules():
+    """The current process-wide :class:`Rules`, loaded on first use and
+    reloaded when the rules file changes."""
+    global _store
+    if _store is None:
+        _store = RulesStore()
+    return _store.get()
+
+
+class Reason(IntFlag):
+    """Why an applicant failed, as bit flags so several can be combined."""
+
+    CITIZENSHIP = 1
+    RESIDENCY = 2
+    PROPERTY = 4
+    INDEPENDENT_INCOME = 8
+    INCOME = 16
+    ASSETS = 32
+
+
+# What each failure reason tells the applicant, in the order they are shown.
+NOTE_TEMPLATES = {
+    Reason.CITIZENSHIP: "You must be an Australian citizen or permanent resident to be eligible.",
+    Reason.RESIDENCY: "You need to be a {state} resident to apply here.",
+    Reason.PROPERTY: "Property owners are generally ineligible.",
+    Reason.INDEPENDENT_INCOME: "{state} requires at least one applicant with independent income.",
+    Reason.INCOME: "Income exceeds {state} limit of ~${income_limit}/week for {household_size} people.",
+    Reason.ASSETS: "Assets exceed {state} limit of ~${asset_limit}.",
+}
+PRIORITY_NOTE = "You may qualify for priority access, reducing wait times."
+
+
+# Plain-int views of the flags, so assess() can build a bitmask without
+# creating an IntFlag per operation.
+_CITIZENSHIP, _RESIDENCY, _PROPERTY, _INDEPENDENT_INCOME, _INCOME, _ASSETS = (int(reason) for reason in Reason)
+_REASONS = tuple(Reason(bits) for bits in range(64))  # every combination, shared
+
+
+@functools.lru_cache(maxsize=ASSESSMENT_CACHE_SIZE)
+def format_notes(reasons, state, household_size, income_limit, asset_limit, priority):
+    """The applicant-facing notes for a result, from the shared templates.
+
+    Cached, so identical results share one tuple of strings.
+    """
+    notes = [
+        template.format(state=state, household_size=household_size,
+                        income_limit=income_limit, asset_limit=asset_limit)
+        for reason, template in NOTE_TEMPLATES.items() if reasons & reason
+    ]
+    if priority:
+        notes.append(PRIORITY_NOTE)
+    return tuple(notes)
+
+
+@dataclass(frozen=True, slots=True)
+class Applicant:
+    """Answers from the quiz form. Yes/No questions are booleans."""
+
+    state: str
+    citizenship: bool
+    state_resident: bool
+    owns_property: bool
+    household_size: int
+    has_independent_income: bool
+    income: float
+    assets: float
+    priority: bool
+
+
+# The Yes/No answers, in the order the static pages and the JS bundle key them
+FLAG_FIELDS = ("citizenship", "state_resident", "owns_property", "has_independent_income", "priority")
+
+
+@dataclass(frozen=True, slots=True)
+class Assessment:
+    """The outcome of :func:`assess`. Strings are shared with the rules and
+    notes are only formatted when read (see :attr:`notes`)."""
+
+    eligible: bool
+    income_limit: int
+    asset_limit: int
+    wait_estimate: str
+    apply_link: str
+    rules_version: str
+    state: str
+    household_size: int
+    priority: bool
+    reasons: Reason = Reason(0)
+
+    @property
+    def notes(self):
+        return format_notes(self.reasons, self.state, self.household_size,
+                            self.income_limit, self.asset_limit, self.priority)
+
+
+_STATE_CODES = frozenset(STATES)
+_YES_NO = (True, False)
+_MAX_AMOUNT = sys.float_info.max
+
+
+def check_applicant(applicant):
+    """Raise ``ValueError`` for answers no rule can be applied to: an unknown
+    state, a Yes/No answer that is not a boolean (or 0/1), a household size
+    that is not a whole number from 1 to ``MAX_HOUSEHOLD_SIZE``, or income
+    or assets that are missing, negative or not finite. ``bulk`` and the
+    API reject the same values.
+    """
+    # One expression for the common case; NaN fails the amount comparisons
+    try:
+        if (applicant.state in _STATE_CODES
+                and applicant.citizenship in _YES_NO and applicant.state_resident in _YES_NO
+                and applicant.owns_property in _YES_NO and applicant.has_independent_income in _YES_NO
+                and applicant.priority in _YES_NO
+                and type(applicant.household_size) is int and 1 <= applicant.household_size <= MAX_HOUSEHOLD_SIZE
+                and 0 <= applicant.income <= _MAX_AMOUNT and 0 <= applicant.assets <= _MAX_AMOUNT):
+            return
+    except TypeError:
+        pass
+    _check_fields(applicant)
+
+
+def _check_fields(applicant):
+    """:func:`check_applicant` one field at a time, naming the first invalid one."""
+    def valid(test):
+        try:
+            return test()
+        except (TypeError, ValueError):
+            return False
+
+    if not valid(lambda: applicant.state in _STATE_CODES):
+        raise ValueError(f"Invalid state: {applicant.state!r}")
+    for name in FLAG_FIELDS:
+        value = getattr(applicant, name)
+        if not valid(lambda: value in _YES_NO):
+            raise ValueError(f"Invalid {name}: {value!r}")
+    size = applicant.household_size
+    if not valid(lambda: 1 <= size <= MAX_HOUSEHOLD_SIZE and size == int(size)):
+        raise ValueError(f"Invalid household_size: {size!r}")
+    for name in ("income", "assets"):
+        value = getattr(applicant, name)
+        if not valid(lambda: 0 <= value <= _MAX_AMOUNT):
+            raise ValueError(f"Invalid {name}: {value!r}")
+
+
+def limits(state, household_size, rules=None):
+    """Return ``(income_limit, asset_limit)``; see :meth:`Rules.limits`."""
+    return (rules or get_rules()).limits(state, household_size)
+
+
+def assess(applicant, rules=None):
+    """Assess an :class:`Applicant` and return an :class:`Assessment`.
+
+    Uses the process-wide rules unless ``rules`` is given. Raises
+    ``ValueError`` for answers :func:`check_applicant` rejects.
+    """
+    check_applicant(applicant)
+    rules = rules or get_rules()
+    state = applicant.state
+    household_size = int(applicant.household_size)  # 2.0 or np.int64(2) as a table index
+    income_limit, asset_limit = rules.limits(state, household_size)
+    state_rules = rules.states[state]
+
+    reasons = 0
+    if not applicant.citizenship:
+        reasons |= _CITIZENSHIP
+    elif not applicant.state_resident:
+        reasons |= _RESIDENCY
+    elif applicant.owns_property:
+        reasons |= _PROPERTY
+
+    # e.g. QLD requires an independent income on top of the general rules
+    if state_rules.requires_independent_income and not applicant.has_independent_income:
+        reasons |= _INDEPENDENT_INCOME
+
+    if applicant.income > income_limit:
+        reasons |= _INCOME
+    if applicant.assets > asset_limit:
+        reasons |= _ASSETS
+
+    priority = bool(applicant.priority)
+    return Assessment(
+        eligible=not reasons,
+        income_limit=income_limit,
+        asset_limit=asset_limit,
+        wait_estimate=state_rules.priority_wait if priority else state_rules.general_wait,
+        apply_link=state_rules.apply_link,
+        rules_version=rules.version,
+        state=state,
+        household_size=household_size,
+        priority=priority,
+        reasons=_REASONS[reasons],
+    )
+
+
+# Failure reasons that depend on household size, income or assets
+LIMIT_REASONS = Reason.INCOME | Reason.ASSETS
+
+
+@dataclass(frozen=True)
+class WhatIf:
+    """How far an applicant is from the limits. Headroom is the limit minus
+    the amount, so negative when over it."""
+
+    income_headroom: float
+    asset_headroom: float
+    # Nearest household size with the opposite outcome, if any up to
+    # TABLE_HOUSEHOLD_SIZE (None when another reason decides the outcome)
+    flip_household_size: int | None
+    # Income limit for household sizes 1..TABLE_HOUSEHOLD_SIZE
+    income_curve: tuple
+
+
+def what_if(state, household_size, income, assets, other_reasons=Reason(0), rules=None):
+    """Headroom and eligibility flip point, read off the compiled limit tables.
+
+    ``other_reasons`` are the applicant's failures that do not depend on
+    the limits (``assessment.reasons & ~LIMIT_REASONS``); while any remain,
+    no household size changes the outcome.
+    """
+    rules = rules or get_rules()
+    income_limit, asset_limit = rules.limits(state, household_size)
+    table = rules.limit_tables[state]
+
+    flip = None
+    if not other_reasons:
+        eligible = income <= income_limit and assets <= asset_limit
+        sizes = sorted(range(1, TABLE_HOUSEHOLD_SIZE + 1), key=lambda size: (abs(size - household_size), -size))
+        for size in sizes:
+            size_income, size_assets = table[size]
+            if size != household_size and (income <= size_income and assets <= size_assets) != eligible:
+                flip = size
+                break
+
+    return WhatIf(
+        income_headroom=income_limit - income,
+        asset_headroom=asset_limit - assets,
+        flip_household_size=flip,
+        income_curve=tuple(limit for limit, _ in table[1:]),
+    )
+
+
+@functools.lru_cache(maxsize=ASSESSMENT_CACHE_SIZE)
+def _assess_normalized(rules, *answers):
+    return assess(Applicant(*answers), rules)
+
+
+_cached_rules = None
+
+
+def cached_assess(applicant):
+    """:func:`assess` with a bounded LRU cache over normalised answers.
+
+    Income and assets are rounded up to the dollar for the key, which
+    cannot change the outcome because every limit is a whole dollar
+    amount. The cache is cleared whenever a new rules version is loaded.
+    """
+    global _cached_rules
+    check_applicant(applicant)  # before the answers are normalised into a key
+    rules = get_rules()
+    if rules is not _cached_rules:
+        _assess_normalized.cache_clear()
+        _cached_rules = rules
+    return _assess_normalized(
+        rules,
+        applicant.state,
+        bool(applicant.citizenship),
+        bool(applicant.state_resident),
+        bool(applicant.owns_property),
+        int(applicant.household_size),
+        bool(applicant.has_independent_income),
+        math.ceil(applicant.income),
+        math.ceil(applicant.assets),
+        bool(applicant.priority),
+    )
+
+
+def cache_stats():
+    """Hit/miss counters and size of the :func:`cached_assess` cache."""
+    info = _assess_normalized.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+        "hit_rate": info.hits / lookups if lookups else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate a rules file.")
+    parser.add_argument("path", nargs="?", help="rules file (default: $HOUSING_QUIZ_RULES or rules/2025.toml)")
+    parser.add_argument("--compile", action="store_true", help="also write the precompiled artifact beside it")
+    args = parser.parse_args(argv)
+    if args.compile:
+        target, rules = compile_rules_file(args.path)
+        print(f"Wrote {target} (rules version {rules.version})")
+    else:
+        rules = load_rules(args.path)
+        print(f"{rules_path(args.path)}: rules version {rules.version} OK")
+
+
+if __name__ == "__main__":
+    main()
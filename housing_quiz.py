@@ -1,781 +1,195 @@
-import streamlit as st
-
-st.title("Aussie Public Housing Eligibility Quiz")
-st.write("Answer the questions to get a quick assessment. Based on 2025 rules. Helps navigate red tape.")
-st.write("Note: Eligibility varies by state/territory.")
-st.markdown("*Not official advice. Always verify with government sites.*")
-
-with st.form(key="quiz_form"):
-    states = ["NSW", "VIC", "QLD", "SA", "WA", "TAS", "NT", "ACT"]
-    state = st.selectbox("Which state/territory are you applying in?", states)
-    citizenship = st.radio("Are you an Australian citizen or permanent resident?", ("Yes", "No"))
-    state_resident = st.radio(f"Are you a resident of {state}?", ("Yes", "No"))
-    owns_property = st.radio("Do you own or partly own any property in Australia?", ("Yes", "No"))
-    household_size = st.number_input("How many people in your household (including yourself)?", min_value=1, step=1)
-    has_independent_income = st.radio("Does at least one household member have an independent income?", ("Yes", "No"))
-    st.write("Income limits are weekly gross before tax. Assets exclude super but include cash/savings.")
-    income = st.number_input("What's your household's total weekly gross income? (e.g., 800)", min_value=0.0, step=1.0)
-    assets = st.number_input("What's your household's total assessable assets? (e.g., 5000)", min_value=0.0, step=1.0)
-    priority = st.radio("Do you have priority needs? (e.g., homelessness, disability, domestic violence)", ("Yes", "No"))
-    submit = st.form_submit_button("Submit and Assess")
-
-if submit:
-    eligible = True
-    notes = []
-
-    if citizenship == "No":
-        eligible = False
-        notes.append("You must be an Australian citizen or permanent resident to be eligible.")
-    elif state_resident == "No":
-        eligible = False
-        notes.append(f"You need to be a {state} resident to apply here.")
-    elif owns_property == "Yes":
-        eligible = False
-        notes.append("Property owners are generally ineligible.")
-
-    if state == "NSW":
-        income_limit = 780 if household_size == 1 else 1075 if household_size == 2 else 1075 + (household_size - 2) * 295
-        asset_limit = 38000 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "VIC":
-        income_limit = 1157 if household_size == 1 else 1769 if household_size == 2 else 1769 + (household_size - 2) * 617
-        asset_limit = 22998
-    elif state == "QLD":
-        income_limit = 609 if household_size == 1 else 742 if household_size == 2 else 742 + (household_size - 2) * 133
-        asset_limit = 122875 if household_size == 1 else 147875 if household_size == 2 else 172875
-        if has_independent_income == "No":
-            eligible = False
-            notes.append("QLD requires at least one applicant with independent income.")
-    elif state == "SA":
-        income_limit = 869 if household_size == 1 else 1062 if household_size == 2 else 1062 + (household_size - 2) * 193
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "WA":
-        income_limit = 606 if household_size == 1 else 808 if household_size == 2 else 808 + (household_size - 2) * 202
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "TAS":
-        income_limit = 780 if household_size == 1 else 1075 if household_size == 2 else 1075 + (household_size - 2) * 295
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "NT":
-        income_limit = 800 if household_size == 1 else 1100 if household_size == 2 else 1100 + (household_size - 2) * 300
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "ACT":
-        income_limit = 887 if household_size == 1 else 1109 if household_size == 2 else 1109 + (household_size - 2) * 148
-        asset_limit = 40000
-
-    if income > income_limit:
-        eligible = False
-        notes.append(f"Income exceeds {state} limit of ~${income_limit}/week for {household_size} people.")
-    if assets > asset_limit:
-        eligible = False
-        notes.append(f"Assets exceed {state} limit of ~${asset_limit}.")
-
-    if priority == "Yes":
-        notes.append("You may qualify for priority access, reducing wait times.")
-
-    priority_wait = {
-        "NSW": "1-2 years", "VIC": "18-20 months", "QLD": "21-28 months", "SA": "1-3 years",
-        "WA": "2-3 years", "TAS": "1-2 years", "NT": "5-8 years", "ACT": "1-2 years"
-    }
-    general_wait = {
-        "NSW": "5-10 years", "VIC": "3-5 years", "QLD": "3-5 years", "SA": "3-5 years",
-        "WA": "3-5 years", "TAS": "2-3 years", "NT": "8-10 years", "ACT": "3-5 years"
-    }
-    wait_estimate = priority_wait[state] if priority == "Yes" else general_wait[state]
-
-    st.subheader("Assessment")
-    if eligible:
-        st.success("Based on your answers, you may be eligible! Apply soon to join the waitlist.")
-    else:
-        st.error("You may not be eligible due to:")
-        for note in notes:
-            st.write(f"- {note}")
-
-    st.write(f"Estimated wait time in {state}: {wait_estimate} (varies by location and demand; check official reports).")
-
-    st.subheader("Next Steps Without Red Tape")
-    st.write("1. Gather docs: ID, income proof, Centrelink statements.")
-    st.write("2. Apply online:")
-    apply_links = {
-        "NSW": "https://www.facs.nsw.gov.au/housing/apply",
-        "VIC": "https://www.housing.vic.gov.au/apply-social-housing",
-        "QLD": "https://www.qld.gov.au/housing/public-community-housing/apply",
-        "SA": "https://housing.sa.gov.au/services/public-housing/apply-for-housing",
-        "WA": "https://www.wa.gov.au/service/housing-and-property/public-housing/apply-public-housing",
-        "TAS": "https://www.homestasmania.com.au/Apply-for-Housing",
-        "NT": "https://nt.gov.au/property/social-housing/apply-for-housing/apply-for-public-housing",
-        "ACT": "https://www.act.gov.au/housing-planning-and-property/public-housing/apply-for-housing"
-    }
-    st.write(f"- {apply_links[state]}")
-    st.write("3. For full national info: https://my.gov.au/en/services/living-arrangements/finding-renting-and-buying-a-home/help-with-homelessness/social-public-and-community-housing")
-    st.write("4. If stuck, contact a housing support service like 1800 825 955 (national homelessness hotline).")
-
-st.title("Aussie Public Housing Eligibility Quiz")
-st.write("Answer the questions to get a quick assessment. Based on 2025 rules. Helps navigate red tape.")
-st.write("Note: Eligibility varies by state/territory.")
-st.markdown("*Not official advice. Always verify with government sites.*")
-
-with st.form(key="quiz_form"):
-    states = ["NSW", "VIC", "QLD", "SA", "WA", "TAS", "NT", "ACT"]
-    state = st.selectbox("Which state/territory are you applying in?", states)
-    citizenship = st.radio("Are you an Australian citizen or permanent resident?", ("Yes", "No"))
-    state_resident = st.radio(f"Are you a resident of {state}?", ("Yes", "No"))
-    owns_property = st.radio("Do you own or partly own any property in Australia?", ("Yes", "No"))
-    household_size = st.number_input("How many people in your household (including yourself)?", min_value=1, step=1)
-    has_independent_income = st.radio("Does at least one household member have an independent income?", ("Yes", "No"))
-    st.write("Income limits are weekly gross before tax. Assets exclude super but include cash/savings.")
-    income = st.number_input("What's your household's total weekly gross income? (e.g., 800)", min_value=0.0, step=1.0)
-    assets = st.number_input("What's your household's total assessable assets? (e.g., 5000)", min_value=0.0, step=1.0)
-    priority = st.radio("Do you have priority needs? (e.g., homelessness, disability, domestic violence)", ("Yes", "No"))
-    submit = st.form_submit_button("Submit and Assess")
-
-if submit:
-    eligible = True
-    notes = []
-
-    if citizenship == "No":
-        eligible = False
-        notes.append("You must be an Australian citizen or permanent resident to be eligible.")
-    elif state_resident == "No":
-        eligible = False
-        notes.append(f"You need to be a {state} resident to apply here.")
-    elif owns_property == "Yes":
-        eligible = False
-        notes.append("Property owners are generally ineligible.")
-
-    if state == "NSW":
-        income_limit = 780 if household_size == 1 else 1075 if household_size == 2 else 1075 + (household_size - 2) * 295
-        asset_limit = 38000 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "VIC":
-        income_limit = 1157 if household_size == 1 else 1769 if household_size == 2 else 1769 + (household_size - 2) * 617
-        asset_limit = 22998
-    elif state == "QLD":
-        income_limit = 609 if household_size == 1 else 742 if household_size == 2 else 742 + (household_size - 2) * 133
-        asset_limit = 122875 if household_size == 1 else 147875 if household_size == 2 else 172875
-        if has_independent_income == "No":
-            eligible = False
-            notes.append("QLD requires at least one applicant with independent income.")
-    elif state == "SA":
-        income_limit = 869 if household_size == 1 else 1062 if household_size == 2 else 1062 + (household_size - 2) * 193
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "WA":
-        income_limit = 606 if household_size == 1 else 808 if household_size == 2 else 808 + (household_size - 2) * 202
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "TAS":
-        income_limit = 780 if household_size == 1 else 1075 if household_size == 2 else 1075 + (household_size - 2) * 295
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "NT":
-        income_limit = 800 if household_size == 1 else 1100 if household_size == 2 else 1100 + (household_size - 2) * 300
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "ACT":
-        income_limit = 887 if household_size == 1 else 1109 if household_size == 2 else 1109 + (household_size - 2) * 148
-        asset_limit = 40000
-
-    if income > income_limit:
-        eligible = False
-        notes.append(f"Income exceeds {state} limit of ~${income_limit}/week for {household_size} people.")
-    if assets > asset_limit:
-        eligible = False
-        notes.append(f"Assets exceed {state} limit of ~${asset_limit}.")
-
-    if priority == "Yes":
-        notes.append("You may qualify for priority access, reducing wait times.")
-
-    priority_wait = {
-        "NSW": "1-2 years", "VIC": "18-20 months", "QLD": "21-28 months", "SA": "1-3 years",
-        "WA": "2-3 years", "TAS": "1-2 years", "NT": "5-8 years", "ACT": "1-2 years"
-    }
-    general_wait = {
-        "NSW": "5-10 years", "VIC": "3-5 years", "QLD": "3-5 years", "SA": "3-5 years",
-        "WA": "3-5 years", "TAS": "2-3 years", "NT": "8-10 years", "ACT": "3-5 years"
-    }
-    wait_estimate = priority_wait[state] if priority == "Yes" else general_wait[state]
-
-    st.subheader("Assessment")
-    if eligible:
-        st.success("Based on your answers, you may be eligible! Apply soon to join the waitlist.")
-    else:
-        st.error("You may not be eligible due to:")
-        for note in notes:
-            st.write(f"- {note}")
-
-    st.write(f"Estimated wait time in {state}: {wait_estimate} (varies by location and demand; check official reports).")
-
-    st.subheader("Next Steps Without Red Tape")
-    st.write("1. Gather docs: ID, income proof, Centrelink statements.")
-    st.write("2. Apply online:")
-    apply_links = {
-        "NSW": "https://www.facs.nsw.gov.au/housing/apply",
-        "VIC": "https://www.housing.vic.gov.au/apply-social-housing",
-        "QLD": "https://www.qld.gov.au/housing/public-community-housing/apply",
-        "SA": "https://housing.sa.gov.au/services/public-housing/apply-for-housing",
-        "WA": "https://www.wa.gov.au/service/housing-and-property/public-housing/apply-public-housing",
-        "TAS": "https://www.homestasmania.com.au/Apply-for-Housing",
-        "NT": "https://nt.gov.au/property/social-housing/apply-for-housing/apply-for-public-housing",
-        "ACT": "https://www.act.gov.au/housing-planning-and-property/public-housing/apply-for-housing"
-    }
-    st.write(f"- {apply_links[state]}")
-    st.write("3. For full national info: https://my.gov.au/en/services/living-arrangements/finding-renting-and-buying-a-home/help-with-homelessness/social-public-and-community-housing")
-    st.write("4. If stuck, contact a housing support service like 1800 825 955 (national homelessness hotline).")
-
-st.title("Aussie Public Housing Eligibility Quiz")
-st.write("Answer the questions to get a quick assessment. Based on 2025 rules. Helps navigate red tape.")
-st.write("Note: Eligibility varies by state/territory.")
-st.markdown("*Not official advice. Always verify with government sites.*")
-
-with st.form(key="quiz_form"):
-    states = ["NSW", "VIC", "QLD", "SA", "WA", "TAS", "NT", "ACT"]
-    state = st.selectbox("Which state/territory are you applying in?", states)
-    citizenship = st.radio("Are you an Australian citizen or permanent resident?", ("Yes", "No"))
-    state_resident = st.radio(f"Are you a resident of {state}?", ("Yes", "No"))
-    owns_property = st.radio("Do you own or partly own any property in Australia?", ("Yes", "No"))
-    household_size = st.number_input("How many people in your household (including yourself)?", min_value=1, step=1)
-    has_independent_income = st.radio("Does at least one household member have an independent income?", ("Yes", "No"))
-    st.write("Income limits are weekly gross before tax. Assets exclude super but include cash/savings.")
-    income = st.number_input("What's your household's total weekly gross income? (e.g., 800)", min_value=0.0, step=1.0)
-    assets = st.number_input("What's your household's total assessable assets? (e.g., 5000)", min_value=0.0, step=1.0)
-    priority = st.radio("Do you have priority needs? (e.g., homelessness, disability, domestic violence)", ("Yes", "No"))
-    submit = st.form_submit_button("Submit and Assess")
-
-if submit:
-    eligible = True
-    notes = []
-
-    if citizenship == "No":
-        eligible = False
-        notes.append("You must be an Australian citizen or permanent resident to be eligible.")
-    elif state_resident == "No":
-        eligible = False
-        notes.append(f"You need to be a {state} resident to apply here.")
-    elif owns_property == "Yes":
-        eligible = False
-        notes.append("Property owners are generally ineligible.")
-
-    if state == "NSW":
-        income_limit = 780 if household_size == 1 else 1075 if household_size == 2 else 1075 + (household_size - 2) * 295
-        asset_limit = 38000 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "VIC":
-        income_limit = 1157 if household_size == 1 else 1769 if household_size == 2 else 1769 + (household_size - 2) * 617
-        asset_limit = 22998
-    elif state == "QLD":
-        income_limit = 609 if household_size == 1 else 742 if household_size == 2 else 742 + (household_size - 2) * 133
-        asset_limit = 122875 if household_size == 1 else 147875 if household_size == 2 else 172875
-        if has_independent_income == "No":
-            eligible = False
-            notes.append("QLD requires at least one applicant with independent income.")
-    elif state == "SA":
-        income_limit = 869 if household_size == 1 else 1062 if household_size == 2 else 1062 + (household_size - 2) * 193
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "WA":
-        income_limit = 606 if household_size == 1 else 808 if household_size == 2 else 808 + (household_size - 2) * 202
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "TAS":
-        income_limit = 780 if household_size == 1 else 1075 if household_size == 2 else 1075 + (household_size - 2) * 295
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "NT":
-        income_limit = 800 if household_size == 1 else 1100 if household_size == 2 else 1100 + (household_size - 2) * 300
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "ACT":
-        income_limit = 887 if household_size == 1 else 1109 if household_size == 2 else 1109 + (household_size - 2) * 148
-        asset_limit = 40000
-
-    if income > income_limit:
-        eligible = False
-        notes.append(f"Income exceeds {state} limit of ~${income_limit}/week for {household_size} people.")
-    if assets > asset_limit:
-        eligible = False
-        notes.append(f"Assets exceed {state} limit of ~${asset_limit}.")
-
-    if priority == "Yes":
-        notes.append("You may qualify for priority access, reducing wait times.")
-
-    priority_wait = {
-        "NSW": "1-2 years", "VIC": "18-20 months", "QLD": "21-28 months", "SA": "1-3 years",
-        "WA": "2-3 years", "TAS": "1-2 years", "NT": "5-8 years", "ACT": "1-2 years"
-    }
-    general_wait = {
-        "NSW": "5-10 years", "VIC": "3-5 years", "QLD": "3-5 years", "SA": "3-5 years",
-        "WA": "3-5 years", "TAS": "2-3 years", "NT": "8-10 years", "ACT": "3-5 years"
-    }
-    wait_estimate = priority_wait[state] if priority == "Yes" else general_wait[state]
-
-    st.subheader("Assessment")
-    if eligible:
-        st.success("Based on your answers, you may be eligible! Apply soon to join the waitlist.")
-    else:
-        st.error("You may not be eligible due to:")
-        for note in notes:
-            st.write(f"- {note}")
-
-    st.write(f"Estimated wait time in {state}: {wait_estimate} (varies by location and demand; check official reports).")
-
-    st.subheader("Next Steps Without Red Tape")
-    st.write("1. Gather docs: ID, income proof, Centrelink statements.")
-    st.write("2. Apply online:")
-    apply_links = {
-        "NSW": "https://www.facs.nsw.gov.au/housing/apply",
-        "VIC": "https://www.housing.vic.gov.au/apply-social-housing",
-        "QLD": "https://www.qld.gov.au/housing/public-community-housing/apply",
-        "SA": "https://housing.sa.gov.au/services/public-housing/apply-for-housing",
-        "WA": "https://www.wa.gov.au/service/housing-and-property/public-housing/apply-public-housing",
-        "TAS": "https://www.homestasmania.com.au/Apply-for-Housing",
-        "NT": "https://nt.gov.au/property/social-housing/apply-for-housing/apply-for-public-housing",
-        "ACT": "https://www.act.gov.au/housing-planning-and-property/public-housing/apply-for-housing"
-    }
-    st.write(f"- {apply_links[state]}")
-    st.write("3. For full national info: https://my.gov.au/en/services/living-arrangements/finding-renting-and-buying-a-home/help-with-homelessness/social-public-and-community-housing")
-    st.write("4. If stuck, contact a housing support service like 1800 825 955 (national homelessness hotline).")
-
-st.title("Aussie Public Housing Eligibility Quiz")
-st.write("Answer the questions to get a quick assessment. Based on 2025 rules. Helps navigate red tape.")
-st.write("Note: Eligibility varies by state/territory.")
-st.markdown("*Not official advice. Always verify with government sites.*")
-
-with st.form(key="quiz_form"):
-    states = ["NSW", "VIC", "QLD", "SA", "WA", "TAS", "NT", "ACT"]
-    state = st.selectbox("Which state/territory are you applying in?", states)
-    citizenship = st.radio("Are you an Australian citizen or permanent resident?", ("Yes", "No"))
-    state_resident = st.radio(f"Are you a resident of {state}?", ("Yes", "No"))
-    owns_property = st.radio("Do you own or partly own any property in Australia?", ("Yes", "No"))
-    household_size = st.number_input("How many people in your household (including yourself)?", min_value=1, step=1)
-    has_independent_income = st.radio("Does at least one household member have an independent income?", ("Yes", "No"))
-    st.write("Income limits are weekly gross before tax. Assets exclude super but include cash/savings.")
-    income = st.number_input("What's your household's total weekly gross income? (e.g., 800)", min_value=0.0, step=1.0)
-    assets = st.number_input("What's your household's total assessable assets? (e.g., 5000)", min_value=0.0, step=1.0)
-    priority = st.radio("Do you have priority needs? (e.g., homelessness, disability, domestic violence)", ("Yes", "No"))
-    submit = st.form_submit_button("Submit and Assess")
-
-if submit:
-    eligible = True
-    notes = []
-
-    if citizenship == "No":
-        eligible = False
-        notes.append("You must be an Australian citizen or permanent resident to be eligible.")
-    elif state_resident == "No":
-        eligible = False
-        notes.append(f"You need to be a {state} resident to apply here.")
-    elif owns_property == "Yes":
-        eligible = False
-        notes.append("Property owners are generally ineligible.")
-
-    if state == "NSW":
-        income_limit = 780 if household_size == 1 else 1075 if household_size == 2 else 1075 + (household_size - 2) * 295
-        asset_limit = 38000 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "VIC":
-        income_limit = 1157 if household_size == 1 else 1769 if household_size == 2 else 1769 + (household_size - 2) * 617
-        asset_limit = 22998
-    elif state == "QLD":
-        income_limit = 609 if household_size == 1 else 742 if household_size == 2 else 742 + (household_size - 2) * 133
-        asset_limit = 122875 if household_size == 1 else 147875 if household_size == 2 else 172875
-        if has_independent_income == "No":
-            eligible = False
-            notes.append("QLD requires at least one applicant with independent income.")
-    elif state == "SA":
-        income_limit = 869 if household_size == 1 else 1062 if household_size == 2 else 1062 + (household_size - 2) * 193
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "WA":
-        income_limit = 606 if household_size == 1 else 808 if household_size == 2 else 808 + (household_size - 2) * 202
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "TAS":
-        income_limit = 780 if household_size == 1 else 1075 if household_size == 2 else 1075 + (household_size - 2) * 295
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "NT":
-        income_limit = 800 if household_size == 1 else 1100 if household_size == 2 else 1100 + (household_size - 2) * 300
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "ACT":
-        income_limit = 887 if household_size == 1 else 1109 if household_size == 2 else 1109 + (household_size - 2) * 148
-        asset_limit = 40000
-
-    if income > income_limit:
-        eligible = False
-        notes.append(f"Income exceeds {state} limit of ~${income_limit}/week for {household_size} people.")
-    if assets > asset_limit:
-        eligible = False
-        notes.append(f"Assets exceed {state} limit of ~${asset_limit}.")
-
-    if priority == "Yes":
-        notes.append("You may qualify for priority access, reducing wait times.")
-
-    priority_wait = {
-        "NSW": "1-2 years", "VIC": "18-20 months", "QLD": "21-28 months", "SA": "1-3 years",
-        "WA": "2-3 years", "TAS": "1-2 years", "NT": "5-8 years", "ACT": "1-2 years"
-    }
-    general_wait = {
-        "NSW": "5-10 years", "VIC": "3-5 years", "QLD": "3-5 years", "SA": "3-5 years",
-        "WA": "3-5 years", "TAS": "2-3 years", "NT": "8-10 years", "ACT": "3-5 years"
-    }
-    wait_estimate = priority_wait[state] if priority == "Yes" else general_wait[state]
-
-    st.subheader("Assessment")
-    if eligible:
-        st.success("Based on your answers, you may be eligible! Apply soon to join the waitlist.")
-    else:
-        st.error("You may not be eligible due to:")
-        for note in notes:
-            st.write(f"- {note}")
-
-    st.write(f"Estimated wait time in {state}: {wait_estimate} (varies by location and demand; check official reports).")
-
-    st.subheader("Next Steps Without Red Tape")
-    st.write("1. Gather docs: ID, income proof, Centrelink statements.")
-    st.write("2. Apply online:")
-    apply_links = {
-        "NSW": "https://www.facs.nsw.gov.au/housing/apply",
-        "VIC": "https://www.housing.vic.gov.au/apply-social-housing",
-        "QLD": "https://www.qld.gov.au/housing/public-community-housing/apply",
-        "SA": "https://housing.sa.gov.au/services/public-housing/apply-for-housing",
-        "WA": "https://www.wa.gov.au/service/housing-and-property/public-housing/apply-public-housing",
-        "TAS": "https://www.homestasmania.com.au/Apply-for-Housing",
-        "NT": "https://nt.gov.au/property/social-housing/apply-for-housing/apply-for-public-housing",
-        "ACT": "https://www.act.gov.au/housing-planning-and-property/public-housing/apply-for-housing"
-    }
-    st.write(f"- {apply_links[state]}")
-    st.write("3. For full national info: https://my.gov.au/en/services/living-arrangements/finding-renting-and-buying-a-home/help-with-homelessness/social-public-and-community-housing")
-    st.write("4. If stuck, contact a housing support service like 1800 825 955 (national homelessness hotline).")
-
-st.title("Aussie Public Housing Eligibility Quiz")
-st.write("Answer the questions to get a quick assessment. Based on 2025 rules. Helps navigate red tape.")
-st.write("Note: Eligibility varies by state/territory.")
-st.markdown("*Not official advice. Always verify with government sites.*")
-
-with st.form(key="quiz_form"):
-    states = ["NSW", "VIC", "QLD", "SA", "WA", "TAS", "NT", "ACT"]
-    state = st.selectbox("Which state/territory are you applying in?", states)
-    citizenship = st.radio("Are you an Australian citizen or permanent resident?", ("Yes", "No"))
-    state_resident = st.radio(f"Are you a resident of {state}?", ("Yes", "No"))
-    owns_property = st.radio("Do you own or partly own any property in Australia?", ("Yes", "No"))
-    household_size = st.number_input("How many people in your household (including yourself)?", min_value=1, step=1)
-    has_independent_income = st.radio("Does at least one household member have an independent income?", ("Yes", "No"))
-    st.write("Income limits are weekly gross before tax. Assets exclude super but include cash/savings.")
-    income = st.number_input("What's your household's total weekly gross income? (e.g., 800)", min_value=0.0, step=1.0)
-    assets = st.number_input("What's your household's total assessable assets? (e.g., 5000)", min_value=0.0, step=1.0)
-    priority = st.radio("Do you have priority needs? (e.g., homelessness, disability, domestic violence)", ("Yes", "No"))
-    submit = st.form_submit_button("Submit and Assess")
-
-if submit:
-    eligible = True
-    notes = []
-
-    if citizenship == "No":
-        eligible = False
-        notes.append("You must be an Australian citizen or permanent resident to be eligible.")
-    elif state_resident == "No":
-        eligible = False
-        notes.append(f"You need to be a {state} resident to apply here.")
-    elif owns_property == "Yes":
-        eligible = False
-        notes.append("Property owners are generally ineligible.")
-
-    if state == "NSW":
-        income_limit = 780 if household_size == 1 else 1075 if household_size == 2 else 1075 + (household_size - 2) * 295
-        asset_limit = 38000 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "VIC":
-        income_limit = 1157 if household_size == 1 else 1769 if household_size == 2 else 1769 + (household_size - 2) * 617
-        asset_limit = 22998
-    elif state == "QLD":
-        income_limit = 609 if household_size == 1 else 742 if household_size == 2 else 742 + (household_size - 2) * 133
-        asset_limit = 122875 if household_size == 1 else 147875 if household_size == 2 else 172875
-        if has_independent_income == "No":
-            eligible = False
-            notes.append("QLD requires at least one applicant with independent income.")
-    elif state == "SA":
-        income_limit = 869 if household_size == 1 else 1062 if household_size == 2 else 1062 + (household_size - 2) * 193
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "WA":
-        income_limit = 606 if household_size == 1 else 808 if household_size == 2 else 808 + (household_size - 2) * 202
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "TAS":
-        income_limit = 780 if household_size == 1 else 1075 if household_size == 2 else 1075 + (household_size - 2) * 295
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "NT":
-        income_limit = 800 if household_size == 1 else 1100 if household_size == 2 else 1100 + (household_size - 2) * 300
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "ACT":
-        income_limit = 887 if household_size == 1 else 1109 if household_size == 2 else 1109 + (household_size - 2) * 148
-        asset_limit = 40000
-
-    if income > income_limit:
-        eligible = False
-        notes.append(f"Income exceeds {state} limit of ~${income_limit}/week for {household_size} people.")
-    if assets > asset_limit:
-        eligible = False
-        notes.append(f"Assets exceed {state} limit of ~${asset_limit}.")
-
-    if priority == "Yes":
-        notes.append("You may qualify for priority access, reducing wait times.")
-
-    priority_wait = {
-        "NSW": "1-2 years", "VIC": "18-20 months", "QLD": "21-28 months", "SA": "1-3 years",
-        "WA": "2-3 years", "TAS": "1-2 years", "NT": "5-8 years", "ACT": "1-2 years"
-    }
-    general_wait = {
-        "NSW": "5-10 years", "VIC": "3-5 years", "QLD": "3-5 years", "SA": "3-5 years",
-        "WA": "3-5 years", "TAS": "2-3 years", "NT": "8-10 years", "ACT": "3-5 years"
-    }
-    wait_estimate = priority_wait[state] if priority == "Yes" else general_wait[state]
-
-    st.subheader("Assessment")
-    if eligible:
-        st.success("Based on your answers, you may be eligible! Apply soon to join the waitlist.")
-    else:
-        st.error("You may not be eligible due to:")
-        for note in notes:
-            st.write(f"- {note}")
-
-    st.write(f"Estimated wait time in {state}: {wait_estimate} (varies by location and demand; check official reports).")
-
-    st.subheader("Next Steps Without Red Tape")
-    st.write("1. Gather docs: ID, income proof, Centrelink statements.")
-    st.write("2. Apply online:")
-    apply_links = {
-        "NSW": "https://www.facs.nsw.gov.au/housing/apply",
-        "VIC": "https://www.housing.vic.gov.au/apply-social-housing",
-        "QLD": "https://www.qld.gov.au/housing/public-community-housing/apply",
-        "SA": "https://housing.sa.gov.au/services/public-housing/apply-for-housing",
-        "WA": "https://www.wa.gov.au/service/housing-and-property/public-housing/apply-public-housing",
-        "TAS": "https://www.homestasmania.com.au/Apply-for-Housing",
-        "NT": "https://nt.gov.au/property/social-housing/apply-for-housing/apply-for-public-housing",
-        "ACT": "https://www.act.gov.au/housing-planning-and-property/public-housing/apply-for-housing"
-    }
-    st.write(f"- {apply_links[state]}")
-    st.write("3. For full national info: https://my.gov.au/en/services/living-arrangements/finding-renting-and-buying-a-home/help-with-homelessness/social-public-and-community-housing")
-    st.write("4. If stuck, contact a housing support service like 1800 825 955 (national homelessness hotline).")
-
-st.title("Aussie Public Housing Eligibility Quiz")
-st.write("Answer the questions to get a quick assessment. Based on 2025 rules. Helps navigate red tape.")
-st.write("Note: Eligibility varies by state/territory.")
-
-with st.form(key="quiz_form"):
-    states = ["NSW", "VIC", "QLD", "SA", "WA", "TAS", "NT", "ACT"]
-    state = st.selectbox("Which state/territory are you applying in?", states)
-    citizenship = st.radio("Are you an Australian citizen or permanent resident?", ("Yes", "No"))
-    state_resident = st.radio(f"Are you a resident of {state}?", ("Yes", "No"))
-    owns_property = st.radio("Do you own or partly own any property in Australia?", ("Yes", "No"))
-    household_size = st.number_input("How many people in your household (including yourself)?", min_value=1, step=1)
-    has_independent_income = st.radio("Does at least one household member have an independent income?", ("Yes", "No"))
-    st.write("Income limits are weekly gross before tax. Assets exclude super but include cash/savings.")
-    income = st.number_input("What's your household's total weekly gross income? (e.g., 800)", min_value=0.0, step=1.0)
-    assets = st.number_input("What's your household's total assessable assets? (e.g., 5000)", min_value=0.0, step=1.0)
-    priority = st.radio("Do you have priority needs? (e.g., homelessness, disability, domestic violence)", ("Yes", "No"))
-    submit = st.form_submit_button("Submit and Assess")
-
-if submit:
-    eligible = True
-    notes = []
-
-    if citizenship == "No":
-        eligible = False
-        notes.append("You must be an Australian citizen or permanent resident to be eligible.")
-    elif state_resident == "No":
-        eligible = False
-        notes.append(f"You need to be a {state} resident to apply here.")
-    elif owns_property == "Yes":
-        eligible = False
-        notes.append("Property owners are generally ineligible.")
-
-    if state == "NSW":
-        income_limit = 780 if household_size == 1 else 1075 if household_size == 2 else 1075 + (household_size - 2) * 295
-        asset_limit = 38000 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "VIC":
-        income_limit = 1157 if household_size == 1 else 1769 if household_size == 2 else 1769 + (household_size - 2) * 617
-        asset_limit = 22998
-    elif state == "QLD":
-        income_limit = 609 if household_size == 1 else 742 if household_size == 2 else 742 + (household_size - 2) * 133
-        asset_limit = 122875 if household_size == 1 else 147875 if household_size == 2 else 172875
-        if has_independent_income == "No":
-            eligible = False
-            notes.append("QLD requires at least one applicant with independent income.")
-    elif state == "SA":
-        income_limit = 869 if household_size == 1 else 1062 if household_size == 2 else 1062 + (household_size - 2) * 193
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "WA":
-        income_limit = 606 if household_size == 1 else 808 if household_size == 2 else 808 + (household_size - 2) * 202
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "TAS":
-        income_limit = 780 if household_size == 1 else 1075 if household_size == 2 else 1075 + (household_size - 2) * 295
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "NT":
-        income_limit = 800 if household_size == 1 else 1100 if household_size == 2 else 1100 + (household_size - 2) * 300
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "ACT":
-        income_limit = 887 if household_size == 1 else 1109 if household_size == 2 else 1109 + (household_size - 2) * 148
-        asset_limit = 40000
-
-    if income > income_limit:
-        eligible = False
-        notes.append(f"Income exceeds {state} limit of ~${income_limit}/week for {household_size} people.")
-    if assets > asset_limit:
-        eligible = False
-        notes.append(f"Assets exceed {state} limit of ~${asset_limit}.")
-
-    if priority == "Yes":
-        notes.append("You may qualify for priority access, reducing wait times.")
-
-    priority_wait = {
-        "NSW": "1-2 years", "VIC": "18-20 months", "QLD": "21-28 months", "SA": "1-3 years",
-        "WA": "2-3 years", "TAS": "1-2 years", "NT": "5-8 years", "ACT": "1-2 years"
-    }
-    general_wait = {
-        "NSW": "5-10 years", "VIC": "3-5 years", "QLD": "3-5 years", "SA": "3-5 years",
-        "WA": "3-5 years", "TAS": "2-3 years", "NT": "8-10 years", "ACT": "3-5 years"
-    }
-    wait_estimate = priority_wait[state] if priority == "Yes" else general_wait[state]
-
-    st.subheader("Assessment")
-    if eligible:
-        st.success("Based on your answers, you may be eligible! Apply soon to join the waitlist.")
-    else:
-        st.error("You may not be eligible due to:")
-        for note in notes:
-            st.write(f"- {note}")
-
-    st.write(f"Estimated wait time in {state}: {wait_estimate} (varies by location and demand; check official reports).")
-
-    st.subheader("Next Steps Without Red Tape")
-    st.write("1. Gather docs: ID, income proof, Centrelink statements.")
-    st.write("2. Apply online:")
-    apply_links = {
-        "NSW": "https://www.facs.nsw.gov.au/housing/apply",
-        "VIC": "https://www.housing.vic.gov.au/apply-social-housing",
-        "QLD": "https://www.qld.gov.au/housing/public-community-housing/apply",
-        "SA": "https://housing.sa.gov.au/services/public-housing/apply-for-housing",
-        "WA": "https://www.wa.gov.au/service/housing-and-property/public-housing/apply-public-housing",
-        "TAS": "https://www.homestasmania.com.au/Apply-for-Housing",
-        "NT": "https://nt.gov.au/property/social-housing/apply-for-housing/apply-for-public-housing",
-        "ACT": "https://www.act.gov.au/housing-planning-and-property/public-housing/apply-for-housing"
-    }
-    st.write(f"- {apply_links[state]}")
-    st.write("3. For full national info: https://my.gov.au/en/services/living-arrangements/finding-renting-and-buying-a-home/help-with-homelessness/social-public-and-community-housing")
-    st.write("4. If stuck, contact a housing support service like 1800 825 955 (national homelessness hotline).")
-
-# Prototype converted to Streamlit App: Australian Public Housing Eligibility Quiz (2025 Edition)
-# This is a basic simulation - not official. Always check government sites for latest.
-
-st.title("Aussie Public Housing Eligibility Quiz")
-st.write("Answer the questions to get a quick assessment. Based on 2025 rules. Helps navigate red tape.")
-st.write("Note: Eligibility varies by state/territory.")
-
-# Use a form to collect all inputs at once
-with st.form(key="quiz_form"):
-    # Supported states
-    states = ["NSW", "VIC", "QLD", "SA", "WA", "TAS", "NT", "ACT"]
-    state = st.selectbox("Which state/territory are you applying in?", states)
-
-    citizenship = st.radio("Are you an Australian citizen or permanent resident?", ("Yes", "No"))
-
-    state_resident = st.radio(f"Are you a resident of {state}?", ("Yes", "No"))
-
-    owns_property = st.radio("Do you own or partly own any property in Australia?", ("Yes", "No"))
-
-    household_size = st.number_input("How many people in your household (including yourself)?", min_value=1, step=1)
-
-    has_independent_income = st.radio("Does at least one household member have an independent income?", ("Yes", "No"))
-
-    st.write("Income limits are weekly gross before tax. Assets exclude super but include cash/savings.")
-    income = st.number_input("What's your household's total weekly gross income? (e.g., 800)", min_value=0.0, step=1.0)
-
-    assets = st.number_input("What's your household's total assessable assets? (e.g., 5000)", min_value=0.0, step=1.0)
-
-    priority = st.radio("Do you have priority needs? (e.g., homelessness, disability, domestic violence)", ("Yes", "No"))
-
-    submit = st.form_submit_button("Submit and Assess")
-
-if submit:
-    # Process eligibility (same logic as prototype)
-    eligible = True
-    notes = []
-
-    if citizenship == "No":
-        eligible = False
-        notes.append("You must be an Australian citizen or permanent resident to be eligible.")
-    elif state_resident == "No":
-        eligible = False
-        notes.append(f"You need to be a {state} resident to apply here.")
-    elif owns_property == "Yes":
-        eligible = False
-        notes.append("Property owners are generally ineligible.")
-
-    # State-Specific Income and Asset Limits (2025 Data) - Same as your prototype
-    if state == "NSW":
-        income_limit = 780 if household_size == 1 else 1075 if household_size == 2 else 1075 + (household_size - 2) * 295
-        asset_limit = 38000 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "VIC":
-        income_limit = 1157 if household_size == 1 else 1769 if household_size == 2 else 1769 + (household_size - 2) * 617
-        asset_limit = 22998
-    elif state == "QLD":
-        income_limit = 609 if household_size == 1 else 742 if household_size == 2 else 742 + (household_size - 2) * 133
-        asset_limit = 122875 if household_size == 1 else 147875 if household_size == 2 else 172875
-        if has_independent_income == "No":
-            eligible = False
-            notes.append("QLD requires at least one applicant with independent income.")
-    elif state == "SA":
-        income_limit = 869 if household_size == 1 else 1062 if household_size == 2 else 1062 + (household_size - 2) * 193
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "WA":
-        income_limit = 606 if household_size == 1 else 808 if household_size == 2 else 808 + (household_size - 2) * 202
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "TAS":
-        income_limit = 780 if household_size == 1 else 1075 if household_size == 2 else 1075 + (household_size - 2) * 295
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "NT":
-        income_limit = 800 if household_size == 1 else 1100 if household_size == 2 else 1100 + (household_size - 2) * 300
-        asset_limit = 38400 if household_size == 1 else 63800 if household_size == 2 else 89000
-    elif state == "ACT":
-        income_limit = 887 if household_size == 1 else 1109 if household_size == 2 else 1109 + (household_size - 2) * 148
-        asset_limit = 40000
-
-    if income > income_limit:
-        eligible = False
-        notes.append(f"Income exceeds {state} limit of ~${income_limit}/week for {household_size} people.")
-    if assets > asset_limit:
-        eligible = False
-        notes.append(f"Assets exceed {state} limit of ~${asset_limit}.")
-
-    if priority == "Yes":
-        notes.append("You may qualify for priority access, reducing wait times.")
-
-    # Wait Time Estimator (same as prototype)
-    priority_wait = {
-        "NSW": "1-2 years", "VIC": "18-20 months", "QLD": "21-28 months", "SA": "1-3 years",
-        "WA": "2-3 years", "TAS": "1-2 years", "NT": "5-8 years", "ACT": "1-2 years"
-    }
-    general_wait = {
-        "NSW": "5-10 years", "VIC": "3-5 years", "QLD": "3-5 years", "SA": "3-5 years",
-        "WA": "3-5 years", "TAS": "2-3 years", "NT": "8-10 years", "ACT": "3-5 years"
-    }
-    wait_estimate = priority_wait[state] if priority == "Yes" else general_wait[state]
-
-    # Display Results
-    st.subheader("Assessment")
-    if eligible:
-        st.success("Based on your answers, you may be eligible! Apply soon to join the waitlist.")
-    else:
-        st.error("You may not be eligible due to:")
-        for note in notes:
-            st.write(f"- {note}")
-
-    st.write(f"Estimated wait time in {state}: {wait_estimate} (varies by location and demand; check official reports).")
-
-    st.subheader("Next Steps Without Red Tape")
-    st.write("1. Gather docs: ID, income proof, Centrelink statements.")
-    st.write("2. Apply online:")
-
-    apply_links = {
-        "NSW": "https://www.facs.nsw.gov.au/housing/apply",
-        "VIC": "https://www.housing.vic.gov.au/apply-social-housing",
-        "QLD": "https://www.qld.gov.au/housing/public-community-housing/apply",
-        "SA": "https://housing.sa.gov.au/services/public-housing/apply-for-housing",
-        "WA": "https://www.wa.gov.au/service/housing-and-property/public-housing/apply-public-housing",
-        "TAS": "https://www.homestasmania.com.au/Apply-for-Housing",
-        "NT": "https://nt.gov.au/property/social-housing/apply-for-housing/apply-for-public-housing",
-        "ACT": "https://www.act.gov.au/housing-planning-and-property/public-housing/apply-for-housing"
-    }
-    st.write(f"- {apply_links[state]}")
-    st.write("3. For full national info: https://my.gov.au/en/services/living-arrangements/finding-renting-and-buying-a-home/help-with-homelessness/social-public-and-community-housing")
-    st.write("4. If stuck, contact a housing support service like 1800 825 955 (national homelessness hotline).")
-
-
-
-
-
-
-
+import os
+import threading
+import time
+
+import streamlit as st
+
+import metrics
+import submission_log
+from eligibility import LIMIT_REASONS, STATES, TABLE_HOUSEHOLD_SIZE, Applicant, cached_assess, get_rules, what_if
+
+# Set to answer the quiz entirely in the browser (for peak traffic)
+CLIENT_SIDE_ENV = "HOUSING_QUIZ_CLIENT_SIDE"
+
+rerun_start = time.perf_counter()
+metrics.start_exporters_from_env()
+
+
+def _prewarm():
+    # Load what the first submission needs while the first visitor is still
+    # reading the form: the rules, the assessment code paths and NumPy.
+    rules = get_rules()
+    cached_assess(Applicant(STATES[0], True, True, False, 1, True, 0.0, 0.0, False))
+    from bulk import compile_rules
+
+    compile_rules(rules)
+
+
+@st.cache_resource(show_spinner=False)
+def prewarm():
+    """Start the warm-up once per server process, after the first page paint."""
+    thread = threading.Thread(target=_prewarm, name="prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+# Prototype converted to Streamlit App: Australian Public Housing Eligibility Quiz (2025 Edition)
+# This is a basic simulation - not official. Always check government sites for latest.
+
+st.title("Aussie Public Housing Eligibility Quiz")
+st.write("Answer the questions to get a quick assessment. Based on 2025 rules. Helps navigate red tape.")
+st.write("Note: Eligibility varies by state/territory.")
+st.markdown("*Not official advice. Always verify with government sites.*")
+
+if os.environ.get(CLIENT_SIDE_ENV):
+    from client_bundle import component_html
+
+    st.iframe(component_html(get_rules()), height=760)
+    st.stop()
+
+
+@st.fragment
+def state_questions():
+    # Its own fragment so that picking a state re-runs only this part, which
+    # keeps the residency question's label in step with the chosen state.
+    with metrics.timer("state_render"):
+        state = st.selectbox("Which state/territory are you applying in?", STATES, key="state")
+
+        st.radio("Are you an Australian citizen or permanent resident?", ("Yes", "No"), key="citizenship")
+
+        st.radio(f"Are you a resident of {state}?", ("Yes", "No"), key="state_resident")
+
+
+@st.fragment
+def household_questions():
+    with metrics.timer("form_render"):
+        # Use a form to collect the rest of the inputs at once
+        with st.form(key="quiz_form"):
+            owns_property = st.radio("Do you own or partly own any property in Australia?", ("Yes", "No"))
+
+            household_size = st.number_input("How many people in your household (including yourself)?", min_value=1, step=1)
+
+            has_independent_income = st.radio("Does at least one household member have an independent income?", ("Yes", "No"))
+
+            st.write("Income limits are weekly gross before tax. Assets exclude super but include cash/savings.")
+            income = st.number_input("What's your household's total weekly gross income? (e.g., 800)", min_value=0.0, step=1.0)
+
+            assets = st.number_input("What's your household's total assessable assets? (e.g., 5000)", min_value=0.0, step=1.0)
+
+            priority = st.radio("Do you have priority needs? (e.g., homelessness, disability, domestic violence)", ("Yes", "No"))
+
+            compare = st.checkbox("Also compare all states and territories")
+
+            submit = st.form_submit_button("Submit and Assess")
+
+    if submit:
+        applicant = Applicant(
+            state=st.session_state.state,
+            citizenship=st.session_state.citizenship == "Yes",
+            state_resident=st.session_state.state_resident == "Yes",
+            owns_property=owns_property == "Yes",
+            household_size=int(household_size),
+            has_independent_income=has_independent_income == "Yes",
+            income=income,
+            assets=assets,
+            priority=priority == "Yes",
+        )
+        with metrics.timer("evaluate"):
+            result = cached_assess(applicant)
+        metrics.record_assessment(applicant.state, result)
+        submission_log.record(applicant, result)
+        comparison = None
+        if compare:
+            from bulk import compare_states  # NumPy stays off the first-paint path
+
+            with metrics.timer("compare"):
+                comparison = compare_states(applicant)
+        # Start the what-if panel from the submitted answers
+        st.session_state.what_if_household_size = applicant.household_size
+        st.session_state.what_if_income = applicant.income
+        results(applicant, result, comparison)
+
+
+# Secondary guidance, shown on demand under the assessment
+NEXT_STEPS = """\
+1. Gather docs: ID, income proof, Centrelink statements.
+2. Apply online: {apply_link}
+3. For full national info: https://my.gov.au/en/services/living-arrangements/finding-renting-and-buying-a-home/help-with-homelessness/social-public-and-community-housing
+4. If stuck, contact a housing support service like 1800 825 955 (national homelessness hotline).
+"""
+
+
+@st.fragment
+def results(applicant, result, comparison=None):
+    state = applicant.state
+    with metrics.timer("result_render"):
+        assessment, panel = st.columns([3, 2])
+        with assessment:
+            # Display Results
+            st.subheader("Assessment")
+            if result.eligible:
+                st.success("Based on your answers, you may be eligible! Apply soon to join the waitlist.")
+            else:
+                st.error("You may not be eligible due to:")
+                for note in result.notes:
+                    st.write(f"- {note}")
+
+            st.write(f"Estimated wait time in {state}: {result.wait_estimate} (varies by location and demand; check official reports).")
+            st.caption(f"Assessed with rules version {result.rules_version}.")
+
+            # Built only while open: opening it re-runs just this fragment
+            next_steps = st.expander("Next Steps Without Red Tape", key="next_steps", on_change="rerun")
+            if next_steps.open:
+                next_steps.markdown(NEXT_STEPS.format(apply_link=result.apply_link))
+
+        with panel:
+            what_if_panel(applicant, result.reasons & ~LIMIT_REASONS)
+
+        if comparison is not None:
+            st.subheader("All states and territories")
+            st.caption("Assuming you lived there, so residency counts as met. Eligible first, then most income headroom.")
+            st.dataframe(comparison, hide_index=True, column_config={
+                "state": "State/territory",
+                "eligible": "Eligible",
+                "reasons": "Fails on",
+                "income_headroom": st.column_config.NumberColumn("Income headroom ($/week)", format="%.0f"),
+                "asset_headroom": st.column_config.NumberColumn("Asset headroom ($)", format="%.0f"),
+                "general_wait": "General wait",
+                "priority_wait": "Priority wait",
+            })
+
+
+@st.fragment
+def what_if_panel(applicant, other_reasons):
+    # Tweaks re-run only this fragment and read the precomputed limit tables;
+    # the form is not resubmitted.
+    with metrics.timer("what_if_render"):
+        st.subheader("What if?")
+        household_size = st.number_input("Household size", min_value=1, step=1, key="what_if_household_size")
+        income = st.number_input("Weekly gross income", min_value=0.0, step=10.0, key="what_if_income")
+        outlook = what_if(applicant.state, int(household_size), income, applicant.assets, other_reasons)
+
+        st.write(f"Income headroom: ${outlook.income_headroom:,.0f}/week"
+                 f"{' (over the limit)' if outlook.income_headroom < 0 else ''}")
+        st.write(f"Asset headroom: ${outlook.asset_headroom:,.0f}"
+                 f"{' (over the limit)' if outlook.asset_headroom < 0 else ''}")
+        if outlook.flip_household_size is not None:
+            st.write(f"Outcome changes at a household size of {outlook.flip_household_size}.")
+        elif other_reasons:
+            st.write("Household size and income alone won't change this outcome.")
+        else:
+            st.write(f"No household size up to {TABLE_HOUSEHOLD_SIZE} changes the outcome.")
+
+        st.line_chart(
+            {"Household size": range(1, TABLE_HOUSEHOLD_SIZE + 1), "Income limit": outlook.income_curve},
+            x="Household size", y="Income limit", height=200,
+        )
+
+
+# Each fragment re-runs on its own when its widgets change; the page as a
+# whole only re-runs on first load.
+state_questions()
+household_questions()
+
+metrics.REGISTRY.observe("rerun", time.perf_counter() - rerun_start)
+prewarm()
@@ -0,0 +1,214 @@
+"""Low-overhead timings and counters for the quiz, the API and batch jobs.
+
+Phases are timed into fixed-bucket histograms and outcomes are counted
+by state, eligibility and failure reason. Everything lives in one
+process-wide :data:`REGISTRY` and is exported either as Prometheus text
+(:func:`serve_http`, or ``GET /metrics`` on the API) or as periodic JSON
+Lines snapshots (:func:`start_jsonl_dump`). Recording costs a couple of
+microseconds, well under 1% of a rerun.
+"""
+
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from eligibility import STATES, Reason, cache_stats, get_rules
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "housing_quiz"
+# Upper bounds (seconds) of the phase timing histogram buckets
+BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+METRICS_PORT_ENV = "HOUSING_QUIZ_METRICS_PORT"
+METRICS_JSONL_ENV = "HOUSING_QUIZ_METRICS_JSONL"
+METRICS_INTERVAL_ENV = "HOUSING_QUIZ_METRICS_INTERVAL"
+
+
+class Histogram:
+    __slots__ = ("buckets", "count", "total")
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKETS) + 1)  # last bucket is +Inf
+        self.count = 0
+        self.total = 0.0
+
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.timings = {}
+        self.counters = {}
+
+    def observe(self, phase, seconds):
+        bucket = bisect.bisect_left(BUCKETS, seconds)
+        with self._lock:
+            histogram = self.timings.get(phase)
+            if histogram is None:
+                histogram = self.timings[phase] = Histogram()
+            histogram.buckets[bucket] += 1
+            histogram.count += 1
+            histogram.total += seconds
+
+    def inc(self, name, labels=(), amount=1):
+        """Add to a counter; ``labels`` is a tuple of ``(name, value)`` pairs."""
+        key = (name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def snapshot(self):
+        with self._lock:
+            timings = {
+                phase: {"count": h.count, "seconds": h.total, "buckets": list(h.buckets)}
+                for phase, h in self.timings.items()
+            }
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in self.counters.items()
+            ]
+        return {"time": time.time(), "timings": timings, "counters": counters,
+                "cache": cache_stats(), "rules_version": get_rules().version}
+
+    def render_prometheus(self):
+        snapshot = self.snapshot()
+        lines = [f"# TYPE {PREFIX}_phase_seconds histogram"]
+        for phase, timing in sorted(snapshot["timings"].items()):
+            cumulative = 0
+            for bound, count in zip(BUCKETS + ("+Inf",), timing["buckets"]):
+                cumulative += count
+                lines.append(f'{PREFIX}_phase_seconds_bucket{{phase="{phase}",le="{bound}"}} {cumulative}')
+            lines.append(f'{PREFIX}_phase_seconds_sum{{phase="{phase}"}} {timing["seconds"]:.6f}')
+            lines.append(f'{PREFIX}_phase_seconds_count{{phase="{phase}"}} {timing["count"]}')
+
+        seen = set()
+        for counter in sorted(snapshot["counters"], key=lambda c: (c["name"], sorted(c["labels"].items()))):
+            name = f"{PREFIX}_{counter['name']}_total"
+            if name not in seen:
+                lines.append(f"# TYPE {name} counter")
+                seen.add(name)
+            labels = ",".join(f'{key}="{value}"' for key, value in sorted(counter["labels"].items()))
+            lines.append(f"{name}{{{labels}}} {counter['value']}")
+
+        cache = snapshot["cache"]
+        lines += [
+            f"# TYPE {PREFIX}_assessment_cache_hits_total counter",
+            f"{PREFIX}_assessment_cache_hits_total {cache['hits']}",
+            f"# TYPE {PREFIX}_assessment_cache_misses_total counter",
+            f"{PREFIX}_assessment_cache_misses_total {cache['misses']}",
+            f"# TYPE {PREFIX}_assessment_cache_size gauge",
+            f"{PREFIX}_assessment_cache_size {cache['size']}",
+            f"# TYPE {PREFIX}_rules_info gauge",
+            f'{PREFIX}_rules_info{{version="{snapshot["rules_version"]}"}} 1',
+        ]
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+@contextmanager
+def timer(phase):
+    """Time the body of a ``with`` block as ``phase``."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        REGISTRY.observe(phase, time.perf_counter() - start)
+
+
+def record_assessment(state, result):
+    """Count one :class:`eligibility.Assessment` by state, outcome and reason."""
+    outcome = "eligible" if result.eligible else "ineligible"
+    REGISTRY.inc("submissions", (("state", state), ("outcome", outcome)))
+    for reason in Reason:
+        if result.reasons & reason:
+            REGISTRY.inc("failures", (("state", state), ("reason", reason.name.lower())))
+
+
+def record_batch(batch, result):
+    """Count a :class:`bulk.BulkResult` the same way, a few bincounts per batch."""
+    import numpy as np  # not needed by the quiz page, so kept off its start-up path
+
+    n_states = len(STATES)
+    eligible = np.bincount(batch.state[result.eligible], minlength=n_states)
+    total = np.bincount(batch.state, minlength=n_states)
+    for code, state in enumerate(STATES):
+        if eligible[code]:
+            REGISTRY.inc("submissions", (("state", state), ("outcome", "eligible")), int(eligible[code]))
+        if total[code] - eligible[code]:
+            REGISTRY.inc("submissions", (("state", state), ("outcome", "ineligible")),
+                         int(total[code] - eligible[code]))
+    for reason in Reason:
+        failed = np.bincount(batch.state[(result.reasons & reason.value) != 0], minlength=n_states)
+        for code in np.flatnonzero(failed):
+            REGISTRY.inc("failures", (("state", STATES[code]), ("reason", reason.name.lower())), int(failed[code]))
+
+
+def serve_http(port, host="0.0.0.0"):
+    """Serve ``GET /metrics`` from a daemon thread."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            body = REGISTRY.render_prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+
+def start_jsonl_dump(path, interval=60.0):
+    """Append a snapshot to ``path`` every ``interval`` seconds from a daemon thread."""
+    def dump():
+        while True:
+            time.sleep(interval)
+            try:
+                with open(path, "a") as f:
+                    f.write(json.dumps(REGISTRY.snapshot()) + "\n")
+            except OSError as exc:
+                logger.warning("Could not write metrics to %s: %s", path, exc)
+
+    thread = threading.Thread(target=dump, name="metrics-jsonl", daemon=True)
+    thread.start()
+    return thread
+
+
+_exporters_lock = threading.Lock()
+_exporters_started = False
+
+
+def start_exporters_from_env():
+    """Start the exporters configured by environment variables, once per process.
+
+    ``HOUSING_QUIZ_METRICS_PORT`` serves Prometheus text on that port;
+    ``HOUSING_QUIZ_METRICS_JSONL`` appends snapshots to that file every
+    ``HOUSING_QUIZ_METRICS_INTERVAL`` seconds (default 60).
+    """
+    global _exporters_started
+    if _exporters_started:
+        return
+    with _exporters_lock:
+        if _exporters_started:
+            return
+        _exporters_started = True
+        port = os.environ.get(METRICS_PORT_ENV)
+        if port:
+            serve_http(int(port))
+        path = os.environ.get(METRICS_JSONL_ENV)
+        if path:
+            start_jsonl_dump(path, float(os.environ.get(METRICS_INTERVAL_ENV, 60)))
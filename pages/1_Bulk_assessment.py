@@ -0,0 +1,32 @@
+import io
+
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import streamlit as st
+
+from bulk import FIELDS, assess_batch, read_csv, result_columns
+from eligibility import Reason
+
+st.title("Bulk Assessment")
+st.write("For caseworkers: upload a CSV of applicants to triage them all at once.")
+st.markdown("*Not official advice. Always verify with government sites.*")
+st.write(f"Columns: {', '.join(FIELDS)}. Yes/No answers as on the quiz; income is weekly gross.")
+
+uploaded = st.file_uploader("Applicants CSV", type="csv")
+
+if uploaded is not None:
+    try:
+        batch = read_csv(uploaded)
+    except (ValueError, pa.ArrowInvalid) as exc:
+        st.error(f"Could not read the file: {exc}")
+        st.stop()
+
+    result = assess_batch(batch)
+    eligible = int(result.eligible.sum())
+    st.subheader("Summary")
+    st.write(f"{len(result)} applicants assessed: {eligible} may be eligible, {len(result) - eligible} may not.")
+
+    out = io.BytesIO()
+    pacsv.write_csv(pa.table(result_columns(result)), out)
+    st.download_button("Download results (CSV)", out.getvalue(), file_name="assessments.csv", mime="text/csv")
+    st.write("`reasons` is a bit mask: " + ", ".join(f"{reason.value} {reason.name.lower()}" for reason in Reason) + ".")
@@ -0,0 +1,208 @@
+"""Seeded synthetic applicant populations for benchmarks and simulations.
+
+:func:`generate` draws a :class:`bulk.Batch` with NumPy from the
+distributions in a :class:`Population`; the same rows, seed and settings
+always give the same applicants. :func:`write` streams one to CSV, JSON
+Lines or Parquet in chunks, columns as on the quiz form (Yes/No answers
+in the text formats, booleans in Parquet), ready for ``cli.py``,
+``simulate.py`` and the benchmarks.
+
+    python population.py 10000000 -o population.parquet
+    python population.py 100000 -o applicants.csv --seed 7 --set p_priority=0.35
+"""
+
+import argparse
+import dataclasses
+import sys
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from bulk import FIELDS, FLAG_FIELDS, Batch
+from eligibility import STATES
+
+FORMATS = ("csv", "jsonl", "parquet")
+# Rows generated and written at a time
+CHUNK_ROWS = 1 << 20
+
+
+@dataclass(frozen=True)
+class Population:
+    """Distributions to draw applicants from. The defaults are a rough
+    shape of real traffic: mostly small households, most applicants
+    citizens and residents, incomes and assets clustered below the limits."""
+
+    # Relative weight of each state, in STATES order
+    state_weights: tuple = (32, 26, 20, 7, 10, 2, 1, 2)
+    p_citizenship: float = 0.92
+    p_state_resident: float = 0.95
+    p_owns_property: float = 0.06
+    p_independent_income: float = 0.75
+    p_priority: float = 0.2
+    # Each further household member is added with this probability, up to the cap
+    household_extra_p: float = 0.45
+    max_household_size: int = 10
+    # Weekly income and assets are gamma distributed, in whole dollars
+    income_shape: float = 2.5
+    income_scale: float = 300.0
+    asset_shape: float = 0.7
+    asset_scale: float = 25000.0
+
+    def with_settings(self, settings):
+        """A copy with ``name=value`` strings applied (as from ``--set``)."""
+        types = {f.name: type(getattr(self, f.name)) for f in dataclasses.fields(self)}
+        changes = {}
+        for setting in settings:
+            name, _, value = setting.partition("=")
+            if name not in types:
+                raise ValueError(f"Unknown population setting {name!r}; expected one of {', '.join(types)}")
+            if types[name] is tuple:
+                changes[name] = tuple(float(part) for part in value.split(","))
+            else:
+                changes[name] = types[name](value)
+        population = dataclasses.replace(self, **changes)
+        if len(population.state_weights) != len(STATES):
+            raise ValueError(f"state_weights needs {len(STATES)} values, one per state ({', '.join(STATES)})")
+        return population
+
+
+def generate(rows, seed=0, population=Population()):
+    """Draw ``rows`` applicants as a :class:`bulk.Batch`."""
+    rng = np.random.default_rng(seed)
+    weights = np.asarray(population.state_weights, dtype=np.float64)
+    # geometric() counts trials to the first success, so it starts at 1
+    household_size = rng.geometric(1 - population.household_extra_p, rows)
+    return Batch(
+        state=rng.choice(len(STATES), rows, p=weights / weights.sum()).astype(np.int8),
+        citizenship=rng.random(rows) < population.p_citizenship,
+        state_resident=rng.random(rows) < population.p_state_resident,
+        owns_property=rng.random(rows) < population.p_owns_property,
+        household_size=np.minimum(household_size, population.max_household_size),
+        has_independent_income=rng.random(rows) < population.p_independent_income,
+        income=np.round(rng.gamma(population.income_shape, population.income_scale, rows)),
+        assets=np.round(rng.gamma(population.asset_shape, population.asset_scale, rows)),
+        priority=rng.random(rows) < population.p_priority,
+    )
+
+
+def generate_chunks(rows, seed=0, population=Population(), chunk_rows=CHUNK_ROWS):
+    """:func:`generate` in chunks; chunk ``i`` uses its own stream from ``seed``."""
+    streams = np.random.SeedSequence(seed).spawn((rows + chunk_rows - 1) // chunk_rows)
+    for i, stream in enumerate(streams):
+        yield generate(min(chunk_rows, rows - i * chunk_rows), stream, population)
+
+
+def arrow_table(batch, yes_no=True):
+    """The batch as a pyarrow Table with form columns."""
+    import pyarrow as pa
+
+    state = pa.array(STATES).take(pa.array(batch.state))
+    if yes_no:
+        labels = pa.array(["No", "Yes"])
+        flags = {name: labels.take(pa.array(getattr(batch, name).view(np.int8))) for name in FLAG_FIELDS}
+    else:
+        flags = {name: pa.array(getattr(batch, name)) for name in FLAG_FIELDS}
+    columns = {"state": state, "household_size": pa.array(batch.household_size),
+               "income": pa.array(batch.income), "assets": pa.array(batch.assets), **flags}
+    return pa.table({name: columns[name] for name in FIELDS})
+
+
+def encode_jsonl(batch):
+    """JSON Lines for a batch, built column-wise by pyarrow rather than per row.
+
+    Runs of Yes/No and state columns are rendered together: the row's
+    combination of answers picks its text, keys included, from a small
+    table, so each line is joined from a handful of pieces.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    pieces = []
+    texts, codes = [""], None
+
+    def flush_texts():
+        pieces.append(texts[0] if codes is None else pa.array(texts).take(pa.array(codes)))
+
+    for i, name in enumerate(FIELDS):
+        key = ("{" if i == 0 else ", ") + f'"{name}": '
+        if name == "state" or name in FLAG_FIELDS:
+            labels, values = (STATES, batch.state) if name == "state" else (("No", "Yes"), getattr(batch, name))
+            values = values.astype(np.intp)
+            codes = values if codes is None else codes * len(labels) + values
+            texts = [f'{text}{key}"{label}"' for text in texts for label in labels]
+        else:
+            texts = [text + key for text in texts]
+            flush_texts()
+            pieces.append(pc.cast(pa.array(getattr(batch, name).astype(np.int64)), pa.string()))
+            texts, codes = [""], None
+    texts = [text + "}\n" for text in texts]
+    flush_texts()
+
+    lines = pc.binary_join_element_wise(*pieces, "")
+    # The rows are contiguous in the string array's data buffer
+    _, offsets, data = lines.buffers()
+    offsets = np.frombuffer(offsets, dtype=np.int32)[lines.offset:lines.offset + len(lines) + 1]
+    return memoryview(data)[offsets[0]:offsets[-1]]
+
+
+def write(path, rows, seed=0, population=Population(), fmt="csv"):
+    """Write a generated population to ``path`` (``-`` for stdout, text formats only)."""
+    out = sys.stdout.buffer if path == "-" else open(path, "wb")
+    try:
+        if fmt == "parquet":
+            import pyarrow.parquet as pq
+
+            writer = None
+            for batch in generate_chunks(rows, seed, population):
+                table = arrow_table(batch, yes_no=False)
+                writer = writer or pq.ParquetWriter(out, table.schema)
+                writer.write_table(table)
+            if writer:
+                writer.close()
+        elif fmt == "csv":
+            import pyarrow.csv as pacsv
+
+            for i, batch in enumerate(generate_chunks(rows, seed, population)):
+                pacsv.write_csv(arrow_table(batch), out, pacsv.WriteOptions(include_header=i == 0))
+        else:
+            for batch in generate_chunks(rows, seed, population):
+                out.write(encode_jsonl(batch))
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+
+
+def detect_format(path):
+    for fmt, suffixes in (("jsonl", (".jsonl", ".ndjson")), ("parquet", (".parquet",))):
+        if path.endswith(suffixes):
+            return fmt
+    return "csv"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic applicant population.")
+    parser.add_argument("rows", type=int)
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("--format", choices=FORMATS, help="default: from the file extension, else csv")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                        help="override a distribution setting, e.g. p_priority=0.3 or "
+                             "state_weights=1,1,1,1,1,1,1,1 (repeatable)")
+    args = parser.parse_args(argv)
+
+    try:
+        population = Population().with_settings(args.set)
+    except ValueError as exc:
+        parser.error(str(exc))
+    fmt = args.format or detect_format(args.output)
+    if fmt == "parquet" and args.output == "-":
+        parser.error("Parquet output needs a file (-o)")
+    start = time.perf_counter()
+    write(args.output, args.rows, args.seed, population, fmt)
+    elapsed = time.perf_counter() - start
+    print(f"{args.rows:,} applicants written ({elapsed:.2f}s, {args.rows / elapsed:,.0f} rows/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
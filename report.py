@@ -0,0 +1,188 @@
+"""Aggregate reports over the submission log (see ``submission_log``).
+
+Scans the log's Parquet / Arrow IPC files one record batch at a time
+through memory-mapped reads, pushing ``--since/--until/--state/--rules-version``
+filters down to the file scan (whole row groups are skipped using their
+statistics), and folds each batch into running NumPy counts. Memory use
+depends on the number of groups, not the number of rows.
+
+    python report.py /var/log/housing-quiz
+    python report.py logs/ --since 2025-07-01 --state NSW --state VIC --format csv -o report.csv
+
+One row per state and household size (sizes of ``--max-household-size``
+and up are grouped): submissions, eligibility rate, how many failed on
+each reason, and how incomes sat relative to that group's income limit.
+"""
+
+import argparse
+import csv
+import json
+import sys
+from datetime import datetime, timezone
+
+import numpy as np
+
+import submission_log
+from eligibility import STATES, Reason
+
+# Upper edges of income / income_limit buckets; the last bucket is open-ended
+INCOME_RATIO_EDGES = (0.5, 0.75, 0.9, 1.0, 1.1, 1.25, 1.5)
+INCOME_RATIO_LABELS = ("<50%", "50-75%", "75-90%", "90-100%", "100-110%", "110-125%", "125-150%", ">150%")
+SCAN_COLUMNS = ["state", "household_size", "income_band", "income_limit", "eligible", "reasons"]
+LOG_FORMATS = {".parquet": "parquet", ".arrow": "ipc"}
+
+
+class Totals:
+    """Running counts per (state, household size group)."""
+
+    def __init__(self, max_household_size):
+        self.max_household_size = max_household_size
+        self.groups = len(STATES) * max_household_size
+        self.submissions = np.zeros(self.groups, dtype=np.int64)
+        self.eligible = np.zeros(self.groups, dtype=np.int64)
+        self.reasons = np.zeros((len(Reason), self.groups), dtype=np.int64)
+        self.income_ratio = np.zeros((self.groups, len(INCOME_RATIO_LABELS)), dtype=np.int64)
+
+    def add(self, batch):
+        state = batch.column("state")
+        # Map the batch's dictionary onto STATES in case it is ordered differently
+        codes = np.array([STATES.index(code) for code in state.dictionary.to_pylist()], dtype=np.intp)
+        state = codes[state.indices.to_numpy(zero_copy_only=False)]
+        size = np.minimum(batch.column("household_size").to_numpy(), self.max_household_size)
+        group = state * self.max_household_size + (size.astype(np.intp) - 1)
+
+        self.submissions += np.bincount(group, minlength=self.groups)
+        eligible = batch.column("eligible").to_numpy(zero_copy_only=False)
+        self.eligible += np.bincount(group[eligible], minlength=self.groups)
+        reasons = batch.column("reasons").to_numpy()
+        for i, reason in enumerate(Reason):
+            self.reasons[i] += np.bincount(group[(reasons & reason.value) != 0], minlength=self.groups)
+
+        ratio = batch.column("income_band").to_numpy() / batch.column("income_limit").to_numpy()
+        bucket = np.searchsorted(INCOME_RATIO_EDGES, ratio, side="right")
+        cells = np.bincount(group * len(INCOME_RATIO_LABELS) + bucket, minlength=self.income_ratio.size)
+        self.income_ratio += cells.reshape(self.income_ratio.shape)
+
+    def rows(self):
+        for group in np.flatnonzero(self.submissions):
+            state, size = divmod(int(group), self.max_household_size)
+            submissions = int(self.submissions[group])
+            row = {
+                "state": STATES[state],
+                "household_size": f"{size + 1}+" if size + 1 == self.max_household_size else str(size + 1),
+                "submissions": submissions,
+                "eligible_rate": round(int(self.eligible[group]) / submissions, 4),
+            }
+            row.update({f"failed_{reason.name.lower()}": int(self.reasons[i, group])
+                        for i, reason in enumerate(Reason)})
+            row.update({f"income_{label}_of_limit": int(count)
+                        for label, count in zip(INCOME_RATIO_LABELS, self.income_ratio[group])})
+            yield row
+
+
+def log_dataset(directory):
+    """The log's completed files as one ``pyarrow.dataset``, read through mmap."""
+    import pyarrow.dataset as ds
+    from pyarrow import fs
+
+    filesystem = fs.LocalFileSystem(use_mmap=True)
+    selector = fs.FileSelector(str(directory), recursive=True)
+    files = sorted(info.path for info in filesystem.get_file_info(selector)
+                   if info.type == fs.FileType.File and info.extension and f".{info.extension}" in LOG_FORMATS)
+    by_format = {}
+    for path in files:
+        by_format.setdefault(LOG_FORMATS["." + path.rsplit(".", 1)[1]], []).append(path)
+    if not by_format:
+        raise ValueError(f"No submission log files in {directory}")
+    # Parquet has no second-resolution timestamps and reads ``hour`` back in
+    # milliseconds; the log's own schema casts every file to the same types.
+    schema = submission_log.schema()
+    parts = [ds.dataset(paths, schema=schema, format=fmt, filesystem=filesystem) for fmt, paths in by_format.items()]
+    return parts[0] if len(parts) == 1 else ds.dataset(parts, schema=schema)
+
+
+def _timestamp(text):
+    value = datetime.fromisoformat(text)
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def scan_filter(since=None, until=None, states=(), rules_versions=()):
+    """A dataset filter expression for the report options, or ``None``."""
+    import pyarrow.dataset as ds
+
+    conditions = []
+    if since:
+        conditions.append(ds.field("hour") >= _timestamp(since))
+    if until:
+        conditions.append(ds.field("hour") < _timestamp(until))
+    if states:
+        conditions.append(ds.field("state").isin(list(states)))
+    if rules_versions:
+        conditions.append(ds.field("rules_version").isin(list(rules_versions)))
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+    return expression
+
+
+def build_report(directory, max_household_size=6, **filters):
+    dataset = log_dataset(directory)
+    totals = Totals(max_household_size)
+    for batch in dataset.to_batches(columns=SCAN_COLUMNS, filter=scan_filter(**filters)):
+        if batch.num_rows:
+            totals.add(batch)
+    return list(totals.rows())
+
+
+def write_text(rows, out):
+    columns = ("state", "household_size", "submissions", "eligible_rate")
+    out.write(f"{'state':<6}{'size':>5}{'submissions':>13}{'eligible':>10}  top failure\n")
+    for row in rows:
+        failures = {key[len("failed_"):]: value for key, value in row.items() if key.startswith("failed_") and value}
+        top = max(failures, key=failures.get) if failures else "-"
+        state, size, submissions, rate = (row[column] for column in columns)
+        out.write(f"{state:<6}{size:>5}{submissions:>13,}{rate:>10.1%}  {top}\n")
+
+
+def write_csv(rows, out):
+    if rows:
+        writer = csv.DictWriter(out, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_json(rows, out):
+    json.dump(rows, out, indent=2)
+    out.write("\n")
+
+
+WRITERS = {"text": write_text, "csv": write_csv, "json": write_json}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarise the submission log.")
+    parser.add_argument("directory", help="submission log directory")
+    parser.add_argument("--since", help="first hour to include (ISO date/time, UTC)")
+    parser.add_argument("--until", help="first hour to exclude (ISO date/time, UTC)")
+    parser.add_argument("--state", action="append", choices=STATES, default=[], help="repeatable")
+    parser.add_argument("--rules-version", action="append", default=[], help="repeatable")
+    parser.add_argument("--max-household-size", type=int, default=6,
+                        help="group household sizes from this size up (default: %(default)s)")
+    parser.add_argument("--format", choices=WRITERS, default="text")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    try:
+        rows = build_report(args.directory, args.max_household_size, since=args.since, until=args.until,
+                            states=args.state, rules_versions=args.rules_version)
+    except (OSError, ValueError) as exc:  # no such directory, no log files in it, a bad --since
+        parser.error(str(exc))
+    if args.output:
+        with open(args.output, "w", newline="") as out:
+            WRITERS[args.format](rows, out)
+    else:
+        WRITERS[args.format](rows, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""Opt-in, append-only log of assessments for capacity and policy analysis.
+
+Each submission is reduced to an anonymised row (hour, state, household
+size, income and asset bands, the limits applied, outcome, reason bits
+and rules version) and appended to an in-memory buffer; that is all a
+rerun pays for. A background thread writes the buffer out in batches to
+columnar files, Parquet or Arrow IPC, and starts a new file every
+``rotate_rows`` rows or ``rotate_seconds``. A file is written as
+``*.partial`` and renamed once complete, so readers only see finished
+files.
+
+Enable it for the quiz or the API with ``HOUSING_QUIZ_SUBMISSION_LOG=<dir>``
+(``HOUSING_QUIZ_SUBMISSION_LOG_FORMAT=arrow`` for Arrow IPC).
+"""
+
+import atexit
+import itertools
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from eligibility import STATES
+
+logger = logging.getLogger(__name__)
+
+SUBMISSION_LOG_ENV = "HOUSING_QUIZ_SUBMISSION_LOG"
+SUBMISSION_LOG_FORMAT_ENV = "HOUSING_QUIZ_SUBMISSION_LOG_FORMAT"
+FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+# Amounts are logged as the lower edge of these bands, never exactly
+INCOME_BAND = 50  # $/week
+ASSET_BAND = 5000  # $
+# Times are logged to the hour
+TIME_BUCKET = 3600
+# Rows per Parquet row group / Arrow IPC record batch in the files
+ROW_GROUP_ROWS = 65536
+
+# Amounts and limits are stored as int32 and saturate at the largest band edge
+_INT32_MAX = 2**31 - 1
+_INCOME_CAP = _INT32_MAX // INCOME_BAND * INCOME_BAND
+_ASSET_CAP = _INT32_MAX // ASSET_BAND * ASSET_BAND
+
+COLUMNS = ("hour", "state", "household_size", "income_band", "asset_band",
+           "income_limit", "asset_limit", "eligible", "reasons", "rules_version")
+_STATE_CODES = {code: i for i, code in enumerate(STATES)}
+_file_numbers = itertools.count()
+
+
+def schema():
+    import pyarrow as pa
+
+    return pa.schema([
+        ("hour", pa.timestamp("s", tz="UTC")),
+        ("state", pa.dictionary(pa.int8(), pa.string())),
+        ("household_size", pa.int16()),
+        ("income_band", pa.int32()),
+        ("asset_band", pa.int32()),
+        ("income_limit", pa.int32()),
+        ("asset_limit", pa.int32()),
+        ("eligible", pa.bool_()),
+        ("reasons", pa.uint8()),
+        ("rules_version", pa.string()),
+    ])
+
+
+def anonymise(applicant, result, now=None):
+    """The logged row for one assessment, as a tuple in ``COLUMNS`` order."""
+    now = time.time() if now is None else now
+    return (
+        int(now) // TIME_BUCKET * TIME_BUCKET,
+        _STATE_CODES[applicant.state],
+        min(int(applicant.household_size), 32767),
+        int(min(applicant.income, _INCOME_CAP) // INCOME_BAND) * INCOME_BAND,
+        int(min(applicant.assets, _ASSET_CAP) // ASSET_BAND) * ASSET_BAND,
+        min(result.income_limit, _INT32_MAX),
+        min(result.asset_limit, _INT32_MAX),
+        bool(result.eligible),
+        int(result.reasons),
+        result.rules_version,
+    )
+
+
+def anonymise_batch(batch, result, now=None):
+    """:func:`anonymise` for a ``bulk.Batch`` and its ``bulk.BulkResult``, as a list of rows."""
+    import numpy as np
+
+    now = time.time() if now is None else now
+    rows = len(batch)
+    columns = (
+        [int(now) // TIME_BUCKET * TIME_BUCKET] * rows,
+        batch.state.tolist(),
+        np.minimum(batch.household_size, 32767).tolist(),
+        (np.minimum(batch.income, _INCOME_CAP) // INCOME_BAND * INCOME_BAND).astype(np.int64).tolist(),
+        (np.minimum(batch.assets, _ASSET_CAP) // ASSET_BAND * ASSET_BAND).astype(np.int64).tolist(),
+        np.minimum(result.income_limit, _INT32_MAX).tolist(),
+        np.minimum(result.asset_limit, _INT32_MAX).tolist(),
+        result.eligible.tolist(),
+        result.reasons.tolist(),
+        [result.rules_version] * rows,
+    )
+    return list(zip(*columns))
+
+
+def _record_batch(rows):
+    import pyarrow as pa
+
+    target = schema()
+    columns = list(zip(*rows))
+    arrays = [
+        pa.array(columns[0], target.field("hour").type),
+        pa.DictionaryArray.from_arrays(pa.array(columns[1], pa.int8()), pa.array(STATES)),
+        *(pa.array(column, type) for column, type in zip(columns[2:], target.types[2:])),
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=target)
+
+
+class _Writer:
+    """One output file, renamed from ``*.partial`` when closed."""
+
+    def __init__(self, directory, fmt):
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        name = f"submissions-{stamp}-{os.getpid()}-{next(_file_numbers):04d}{FORMATS[fmt]}"
+        self.path = Path(directory) / name
+        self.partial = self.path.with_name(self.path.name + ".partial")
+        self.rows = 0
+        self.opened = time.monotonic()
+        self._pending = []
+        self._pending_rows = 0
+        if fmt == "parquet":
+            import pyarrow.parquet as pq
+
+            self._writer = pq.ParquetWriter(self.partial, schema(), compression="zstd")
+        else:
+            import pyarrow as pa
+
+            self._writer = pa.ipc.new_file(str(self.partial), schema())
+
+    def write(self, batch):
+        # A file is unreadable until closed anyway, so small flushes are
+        # coalesced into large row groups that scan quickly.
+        self._pending.append(batch)
+        self._pending_rows += batch.num_rows
+        self.rows += batch.num_rows
+        if self._pending_rows >= ROW_GROUP_ROWS:
+            self._write_pending()
+
+    def _write_pending(self):
+        import pyarrow as pa
+
+        if self._pending:
+            self._writer.write_table(pa.Table.from_batches(self._pending).combine_chunks())
+            self._pending, self._pending_rows = [], 0
+
+    def close(self):
+        self._write_pending()
+        self._writer.close()
+        os.replace(self.partial, self.path)
+
+
+class SubmissionLog:
+    """Buffers anonymised assessments and writes them from a daemon thread.
+
+    :meth:`record` only appends to a list under a lock. The writer thread
+    flushes every ``flush_interval`` seconds, or sooner once ``flush_rows``
+    are waiting. If the disk falls behind, rows beyond ``max_buffer`` are
+    dropped (and counted) rather than letting memory grow.
+    """
+
+    def __init__(self, directory, fmt="parquet", flush_rows=1000, flush_interval=5.0,
+                 rotate_rows=1_000_000, rotate_seconds=3600.0, max_buffer=100_000):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown submission log format {fmt!r}; expected one of {', '.join(FORMATS)}")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.format = fmt
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.rotate_rows = rotate_rows
+        self.rotate_seconds = rotate_seconds
+        self.max_buffer = max_buffer
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._rows = []
+        self._wake = threading.Event()
+        self._stopped = False
+        self._writer = None
+        self._thread = threading.Thread(target=self._run, name="submission-log", daemon=True)
+        self._thread.start()
+
+    def record(self, applicant, result):
+        self._append([anonymise(applicant, result)])
+
+    def record_batch(self, batch, result):
+        self._append(anonymise_batch(batch, result))
+
+    def _append(self, rows):
+        with self._lock:
+            room = self.max_buffer - len(self._rows)
+            if len(rows) > room:
+                self.dropped += len(rows) - max(room, 0)
+                rows = rows[:max(room, 0)]
+            self._rows.extend(rows)
+            if len(self._rows) >= self.flush_rows:
+                self._wake.set()
+
+    def _run(self):
+        while not self._stopped:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self, close=False):
+        """Write out everything buffered so far (from the writer thread, or at exit)."""
+        with self._lock:
+            rows, self._rows = self._rows, []
+        try:
+            if rows:
+                if self._writer is None:
+                    self._writer = _Writer(self.directory, self.format)
+                self._writer.write(_record_batch(rows))
+            writer = self._writer
+            if writer is not None and (close or writer.rows >= self.rotate_rows
+                                       or time.monotonic() - writer.opened >= self.rotate_seconds):
+                self._writer = None
+                writer.close()
+        except Exception:
+            logger.exception("Could not write %d submissions to %s", len(rows), self.directory)
+
+    def close(self):
+        """Stop the writer thread and finish the current file."""
+        self._stopped = True
+        self._wake.set()
+        self._thread.join()
+        self.flush(close=True)
+
+
+_log_lock = threading.Lock()
+_log = None
+_log_checked = False
+
+
+def get_log():
+    """The process-wide :class:`SubmissionLog` configured by environment
+    variables, or ``None`` when logging is off."""
+    global _log, _log_checked
+    if _log_checked:
+        return _log
+    with _log_lock:
+        if not _log_checked:
+            directory = os.environ.get(SUBMISSION_LOG_ENV)
+            if directory:
+                _log = SubmissionLog(directory, os.environ.get(SUBMISSION_LOG_FORMAT_ENV, "parquet"))
+                atexit.register(_log.close)
+            _log_checked = True
+    return _log
+
+
+def record(applicant, result):
+    """Log one assessment if the submission log is enabled."""
+    log = get_log()
+    if log is not None:
+        log.record(applicant, result)
+
+
+def record_batch(batch, result):
+    """Log a vectorised assessment (``bulk.Batch`` and ``bulk.BulkResult``)
+    if the submission log is enabled."""
+    log = get_log()
+    if log is not None:
+        log.record_batch(batch, result)
@@ -0,0 +1,62 @@
+"""Benchmark vectorised bulk assessment and check it against ``assess()``.
+
+    python -m tools.bench_bulk [--rows 1000000]
+"""
+
+import argparse
+import time
+
+from bulk import assess_batch
+from eligibility import STATES, Applicant, assess
+from population import Population, generate
+
+
+# Uniform over states and reaching past the limit tables, so the cross-check
+# covers every state and the closed-form tail
+BENCH_POPULATION = Population(
+    state_weights=(1,) * len(STATES), p_citizenship=0.9, p_state_resident=0.9, p_owns_property=0.1,
+    p_independent_income=0.7, household_extra_p=0.6, max_household_size=20,
+    income_shape=2.0, income_scale=450.0, asset_shape=0.8, asset_scale=30000.0,
+)
+
+
+def random_batch(rows, seed=0):
+    return generate(rows, seed, BENCH_POPULATION)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--check", type=int, default=10_000, help="rows to cross-check against assess()")
+    args = parser.parse_args(argv)
+
+    batch = random_batch(args.rows)
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        result = assess_batch(batch)
+        timings.append(time.perf_counter() - start)
+
+    for i in range(min(args.check, args.rows)):
+        expected = assess(Applicant(
+            state=STATES[batch.state[i]],
+            citizenship=bool(batch.citizenship[i]),
+            state_resident=bool(batch.state_resident[i]),
+            owns_property=bool(batch.owns_property[i]),
+            household_size=int(batch.household_size[i]),
+            has_independent_income=bool(batch.has_independent_income[i]),
+            income=float(batch.income[i]),
+            assets=float(batch.assets[i]),
+            priority=bool(batch.priority[i]),
+        ))
+        got = (bool(result.eligible[i]), int(result.reasons[i]), result.wait_estimate[i])
+        assert got == (expected.eligible, int(expected.reasons), expected.wait_estimate), (i, got, expected)
+
+    best = min(timings)
+    print(f"{args.rows} rows in {best * 1000:.1f} ms ({args.rows / best / 1e6:.1f}M rows/s), "
+          f"{result.eligible.mean():.1%} eligible")
+
+
+if __name__ == "__main__":
+    main()
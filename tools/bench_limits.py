@@ -0,0 +1,42 @@
+"""Microbenchmark: precomputed limit tables vs the original if/elif chain.
+
+    python -m tools.bench_limits [--n 200000]
+"""
+
+import argparse
+import random
+import timeit
+
+from eligibility import STATES, get_rules
+from tools.reference import reference_limits
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=200_000, help="lookups per timing run")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    limits = get_rules().limits
+    rng = random.Random(args.seed)
+    # Mostly small households, as in real traffic, with a few above the table size
+    inputs = [(rng.choice(STATES), min(int(rng.expovariate(0.5)) + 1, 25)) for _ in range(args.n)]
+
+    for state, size in set(inputs):
+        assert limits(state, size) == reference_limits(state, size), (state, size)
+
+    def run(fn):
+        def loop():
+            for state, size in inputs:
+                fn(state, size)
+        return min(timeit.repeat(loop, number=1, repeat=args.repeat)) / args.n * 1e9
+
+    chain = run(reference_limits)
+    table = run(limits)
+    print(f"if/elif chain: {chain:7.1f} ns/lookup")
+    print(f"lookup table:  {table:7.1f} ns/lookup  ({chain / table:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
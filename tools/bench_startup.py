@@ -0,0 +1,113 @@
+"""Cold-start time of the quiz: process start to first rendered form.
+
+Launches ``streamlit run housing_quiz.py`` headless, waits for the health
+endpoint, then opens a session over the same websocket the browser uses
+and times the messages of the first run. Each run is a fresh process, so
+nothing is warm but the OS page cache.
+
+    python -m tools.bench_startup [--runs 5] [--budget-ms 2500]
+
+Reported per run (milliseconds since the process was spawned):
+``server_ready`` health check answers, ``first_paint`` first element
+arrives, ``form`` the submit button arrives (the whole form is on screen),
+``finished`` the first run completes.
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from websockets.sync.client import connect
+
+APP = os.path.join(os.path.dirname(__file__), os.pardir, "housing_quiz.py")
+PHASES = ("server_ready", "first_paint", "form", "finished")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_healthy(port, process, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"streamlit exited with status {process.returncode}")
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1).read()
+            return
+        except OSError:
+            time.sleep(0.01)
+    raise TimeoutError("streamlit did not become healthy")
+
+
+def first_run(port, since):
+    """Open a session and time its first run, as a browser tab would."""
+    timings = {}
+    with connect(f"ws://127.0.0.1:{port}/_stcore/stream", subprotocols=["streamlit"], max_size=None) as ws:
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_script_hash = ""
+        ws.send(msg.SerializeToString())
+        while "finished" not in timings:
+            forward = ForwardMsg()
+            forward.ParseFromString(ws.recv(timeout=60))
+            elapsed = time.perf_counter() - since
+            kind = forward.WhichOneof("type")
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                timings.setdefault("first_paint", elapsed)
+                if forward.delta.new_element.WhichOneof("type") == "button":
+                    timings.setdefault("form", elapsed)
+            elif kind == "script_finished":
+                timings["finished"] = elapsed
+    return timings
+
+
+def measure():
+    port = free_port()
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", APP, "--server.headless", "true",
+         "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_healthy(port, process)
+        timings = {"server_ready": time.perf_counter() - start}
+        timings.update(first_run(port, start))
+        return timings
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=2500,
+                        help="fail if the median time to the rendered form exceeds this")
+    args = parser.parse_args(argv)
+
+    runs = []
+    for run in range(args.runs):
+        timings = measure()
+        runs.append(timings)
+        print(f"run {run + 1}: " + "  ".join(f"{phase} {timings[phase] * 1000:7.0f} ms" for phase in PHASES))
+    medians = {phase: statistics.median(timings[phase] for timings in runs) * 1000 for phase in PHASES}
+    print("median: " + "  ".join(f"{phase} {medians[phase]:7.0f} ms" for phase in PHASES))
+    if medians["form"] > args.budget_ms:
+        print(f"form rendered after {medians['form']:.0f} ms, budget is {args.budget_ms:.0f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""Throughput of ``cli.py`` for 1..N worker processes on the same input.
+
+    python -m tools.bench_workers [--rows 2000000] [--max-workers 8]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import population
+
+CLI = os.path.join(os.path.dirname(__file__), os.pardir, "cli.py")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    parser.add_argument("--output-format", choices=("csv", "jsonl"), default="csv")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "applicants.csv")
+        population.write(path, args.rows)
+        baseline = None
+        for workers in range(1, args.max_workers + 1):
+            start = time.perf_counter()
+            subprocess.run(
+                [sys.executable, CLI, path, "-o", os.devnull, "--workers", str(workers),
+                 "--output-format", args.output_format],
+                check=True, stderr=subprocess.DEVNULL,
+            )
+            rate = args.rows / (time.perf_counter() - start)
+            baseline = baseline or rate
+            print(f"workers={workers:<3} {rate:>12,.0f} rows/s  speedup {rate / baseline:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Parity check: the generated JavaScript rules vs ``eligibility.assess``.
+
+Runs the bundle from ``client_bundle.generate_js`` under Node.js over a
+grid of answers, with incomes and assets on either side of every limit,
+and reports any case where the two disagree.
+
+    python -m tools.check_client_parity [--max-household-size 20]
+"""
+
+import argparse
+import itertools
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from client_bundle import generate_js
+from eligibility import FLAG_FIELDS, STATES, Applicant, assess, get_rules
+
+RUNNER = """
+const rules = require(process.argv[1]);
+const cases = JSON.parse(require("fs").readFileSync(0, "utf8"));
+process.stdout.write(JSON.stringify(cases.map(rules.assess)));
+"""
+
+
+def grid(rules, max_household_size):
+    for state in STATES:
+        for household_size in range(1, max_household_size + 1):
+            income_limit, asset_limit = rules.limits(state, household_size)
+            for flags in itertools.product((True, False), repeat=len(FLAG_FIELDS)):
+                for income in (0, income_limit - 1, income_limit, income_limit + 0.5):
+                    for assets in (0, asset_limit, asset_limit + 0.01, asset_limit + 1000):
+                        yield dict(zip(FLAG_FIELDS, flags), state=state, household_size=household_size,
+                                   income=income, assets=assets)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-household-size", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    node = shutil.which("node")
+    if node is None:
+        print("node not found; cannot run the client-side rules")
+        return 2
+
+    rules = get_rules()
+    cases = list(grid(rules, args.max_household_size))
+    with tempfile.TemporaryDirectory() as tmp:
+        bundle = os.path.join(tmp, "eligibility.js")
+        with open(bundle, "w") as f:
+            f.write(generate_js(rules))
+        run = subprocess.run([node, "-e", RUNNER, bundle], input=json.dumps(cases),
+                             capture_output=True, text=True, check=True)
+    client_results = json.loads(run.stdout)
+
+    mismatches = 0
+    for case, client in zip(cases, client_results):
+        expected = assess(Applicant(**case), rules)
+        server = {
+            "eligible": expected.eligible,
+            "reasons": int(expected.reasons),
+            "notes": list(expected.notes),
+            "income_limit": expected.income_limit,
+            "asset_limit": expected.asset_limit,
+            "wait_estimate": expected.wait_estimate,
+            "apply_link": expected.apply_link,
+            "rules_version": expected.rules_version,
+        }
+        if client != server:
+            mismatches += 1
+            if mismatches <= 10:
+                print(f"mismatch for {case}:\n  python: {server}\n  js:     {client}")
+    print(f"{len(cases)} cases, {mismatches} mismatches")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
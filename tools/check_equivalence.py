@@ -0,0 +1,496 @@
+"""Equivalence fuzzing: every fast evaluator vs the original quiz logic.
+
+``tools.reference`` is the oracle. Each engine below is run over the same
+cases and any answer that differs from the oracle's (outcome, notes,
+limits, wait estimate or apply link) is a divergence:
+
+``assess``     the lookup-table rules in ``eligibility``
+``cached``     ``eligibility.cached_assess``, answered from its cache
+``bulk``       ``bulk.assess_batch``, notes rendered from its reason bits
+``static``     the pre-rendered pages of ``build_static`` (document plus
+               the page script's income and asset comparison)
+``client``     the JavaScript bundle from ``client_bundle``, under Node.js
+
+The cases are a boundary grid (every state, answer combination and
+household size from 1 past the lookup tables, with income and assets at,
+just under and just over the oracle's limits) followed by ``--cases``
+random applicants, half of them nudged onto a limit. The first divergence
+of each engine is shrunk to a minimal reproducer.
+
+A last section feeds malformed answers (missing values, NaN and infinite
+amounts, unknown states, fractional or huge household sizes, Yes/No
+answers that are neither) to every engine and to the API's request
+parsing, and checks that each one rejects them with an error naming the
+bad field rather than assessing them.
+
+    python -m tools.check_equivalence [--cases 500000] [--seed 0] [--engine bulk]
+    python -m tools.check_equivalence --case '{"state": "NSW", "assets": 38001, ...}'
+
+The oracle knows only the 2025 rules, so run this with the default rules file.
+"""
+
+import argparse
+import functools
+import importlib.util
+import itertools
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from build_static import result_document
+from bulk import FIELDS, batch_from_columns, assess_batch
+from client_bundle import generate_js
+from eligibility import (MAX_HOUSEHOLD_SIZE, STATES, TABLE_HOUSEHOLD_SIZE, Applicant, assess, cached_assess,
+                         format_notes, get_rules)
+from population import Population, generate
+from tools.reference import reference_assess, reference_limits
+
+OUTCOME_FIELDS = ("eligible", "notes", "income_limit", "asset_limit", "wait_estimate", "apply_link")
+# The answer each Yes/No question shrinks towards
+FLAG_DEFAULTS = {"citizenship": True, "state_resident": True, "owns_property": False,
+                 "has_independent_income": True, "priority": False}
+# 2.0: whole-number sizes that arrive as floats are assessed as that size
+BOUNDARY_SIZES = (*range(1, TABLE_HOUSEHOLD_SIZE + 5), 2.0, 50, MAX_HOUSEHOLD_SIZE)
+# Offsets from a limit that random cases are nudged onto
+LIMIT_OFFSETS = np.array([-1, -0.5, -0.01, 0, 0.01, 0.5, 1])
+FUZZ_POPULATION = Population(
+    state_weights=(1,) * len(STATES),
+    p_citizenship=0.8,
+    p_state_resident=0.8,
+    p_owns_property=0.2,
+    p_independent_income=0.7,
+    p_priority=0.5,
+    household_extra_p=0.6,
+    max_household_size=40,
+    income_scale=400.0,
+    asset_scale=60000.0,
+)
+CHUNK_ROWS = 1 << 16
+# Answers that must be rejected, substituted one at a time into a valid case
+MALFORMED = {
+    "state": (None, "", "XX", -1, len(STATES), 300),
+    **{name: (None, 2, "maybe") for name in FLAG_DEFAULTS},
+    "household_size": (None, 0, -1, 2.7, MAX_HOUSEHOLD_SIZE + 1, 1e30, math.nan, math.inf),
+    "income": (None, math.nan, math.inf, -math.inf, -0.01, "abc"),
+    "assets": (None, math.nan, math.inf, -math.inf, -0.01, "abc"),
+}
+VALID_ANSWERS = {"state": "NSW", **FLAG_DEFAULTS, "household_size": 2, "income": 500.0, "assets": 1000.0}
+
+RUNNER = """
+const rules = require(process.argv[1]);
+// Non-finite numbers arrive as {"$number": "NaN"} and the like
+const cases = JSON.parse(require("fs").readFileSync(0, "utf8"), function (key, value) {
+  return value !== null && typeof value === "object" && "$number" in value ? Number(value.$number) : value;
+});
+const fields = %s;
+// Most cases share an outcome, so each distinct one is sent back once
+const ids = new Map(), distinct = [];
+const index = cases.map(function (row) {
+  const a = {};
+  fields.forEach(function (name, i) { a[name] = row[i]; });
+  let outcome;
+  try {
+    const r = rules.assess(a);
+    outcome = [r.eligible, r.notes, r.income_limit, r.asset_limit, r.wait_estimate, r.apply_link];
+  } catch (error) {
+    outcome = {error: error.message};
+  }
+  const key = JSON.stringify(outcome);
+  if (!ids.has(key)) { ids.set(key, distinct.length); distinct.push(outcome); }
+  return ids.get(key);
+});
+process.stdout.write(JSON.stringify({distinct: distinct, index: index}));
+""" % json.dumps(FIELDS)
+
+
+def oracle(row):
+    yes_no = ("No", "Yes")
+    state, citizenship, state_resident, owns_property, household_size, has_independent_income, income, assets, \
+        priority = row
+    eligible, notes, income_limit, asset_limit, wait_estimate, apply_link = reference_assess(
+        state, yes_no[citizenship], yes_no[state_resident], yes_no[owns_property], int(household_size),
+        yes_no[has_independent_income], income, assets, yes_no[priority])
+    return eligible, tuple(notes), income_limit, asset_limit, wait_estimate, apply_link
+
+
+def _outcome(result):
+    return (result.eligible, tuple(result.notes), result.income_limit, result.asset_limit,
+            result.wait_estimate, result.apply_link)
+
+
+def run_assess(batch, rows, rules):
+    return [_outcome(assess(Applicant(*row), rules)) for row in rows]
+
+
+def run_cached(batch, rows, rules):
+    outcomes = []
+    for row in rows:
+        applicant = Applicant(*row)
+        # The first call may be a miss; the second is always served from the cache
+        cached_assess(applicant)
+        outcomes.append(_outcome(cached_assess(applicant)))
+    return outcomes
+
+
+def run_bulk(batch, rows, rules):
+    result = assess_batch(batch, rules)
+    columns = zip(rows, result.eligible.tolist(), result.reasons.tolist(), result.income_limit.tolist(),
+                  result.asset_limit.tolist(), result.wait_estimate.tolist())
+    return [
+        (eligible, format_notes(reasons, row[0], row[4], income_limit, asset_limit, row[8]),
+         income_limit, asset_limit, wait_estimate, None)
+        for row, eligible, reasons, income_limit, asset_limit, wait_estimate in columns
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def _static_document(rules, state, household_size, flags):
+    return result_document(rules, state, household_size, flags)
+
+
+def run_static(batch, rows, rules):
+    outcomes = []
+    for state, citizenship, state_resident, owns_property, household_size, has_independent_income, income, assets, \
+            priority in rows:
+        if household_size > TABLE_HOUSEHOLD_SIZE:
+            outcomes.append(None)  # no page is built for this size
+            continue
+        flags = (citizenship, state_resident, owns_property, has_independent_income, priority)
+        document = _static_document(rules, state, household_size, flags)
+        # As the page script does
+        notes = list(document["notes"])
+        eligible = document["reasons"] == 0
+        if income > document["income_limit"]:
+            eligible = False
+            notes.append(document["income_note"])
+        if assets > document["asset_limit"]:
+            eligible = False
+            notes.append(document["asset_note"])
+        if document["priority_note"]:
+            notes.append(document["priority_note"])
+        outcomes.append((eligible, tuple(notes), document["income_limit"], document["asset_limit"],
+                         document["wait_estimate"], document["apply_link"]))
+    return outcomes
+
+
+def client_runner(rules, directory):
+    node = shutil.which("node")
+    if node is None:
+        return None
+    bundle = os.path.join(directory, "eligibility.js")
+    with open(bundle, "w") as f:
+        f.write(generate_js(rules))
+
+    def run_client(batch, rows, rules):
+        run = subprocess.run([node, "-e", RUNNER, bundle], input=json.dumps(rows),
+                             capture_output=True, text=True, check=True)
+        results = json.loads(run.stdout)
+        # A rejected case comes back as its error message
+        distinct = [outcome["error"] if isinstance(outcome, dict) else (outcome[0], tuple(outcome[1]), *outcome[2:])
+                    for outcome in results["distinct"]]
+        return [distinct[i] for i in results["index"]]
+
+    return run_client
+
+
+ENGINES = ("assess", "cached", "bulk", "static", "client")
+
+
+def engine_runners(rules, directory):
+    runners = {"assess": run_assess, "cached": run_cached, "bulk": run_bulk, "static": run_static}
+    client = client_runner(rules, directory)
+    if client is not None:
+        runners["client"] = client
+    return runners
+
+
+def differences(expected, actual):
+    """The outcome fields where ``actual`` differs; fields it leaves as ``None`` are not compared."""
+    if actual is None:
+        return []
+    if isinstance(actual, str):
+        return ["rejected"]
+    return [name for name, want, got in zip(OUTCOME_FIELDS, expected, actual) if got is not None and got != want]
+
+
+def rows_of(batch):
+    columns = [getattr(batch, name).tolist() for name in FIELDS]
+    columns[0] = [STATES[i] for i in columns[0]]
+    return list(zip(*columns))
+
+
+def batch_of(rows):
+    return batch_from_columns(dict(zip(FIELDS, (list(column) for column in zip(*rows)))))
+
+
+def boundary_rows():
+    """Every state, answer combination and boundary household size, with
+    income and assets on and either side of the oracle's limits."""
+    for state, household_size in itertools.product(STATES, BOUNDARY_SIZES):
+        income_limit, asset_limit = reference_limits(state, household_size)
+        incomes = (0.0, income_limit - 1.0, float(income_limit), income_limit + 0.01, income_limit + 1.0)
+        amounts = (0.0, asset_limit - 1.0, float(asset_limit), asset_limit + 0.01, asset_limit + 1.0)
+        for citizenship, state_resident, owns_property, has_independent_income, priority in itertools.product(
+                (True, False), repeat=5):
+            for income, assets in itertools.product(incomes, amounts):
+                yield (state, citizenship, state_resident, owns_property, household_size, has_independent_income,
+                       income, assets, priority)
+
+
+def random_batches(rows, seed, chunk_rows=CHUNK_ROWS):
+    """Random applicants in chunks, about half with income and half with
+    assets moved onto (or a cent to a dollar either side of) their limit."""
+    max_size = FUZZ_POPULATION.max_household_size
+    limits = np.array([[reference_limits(state, size) if size else (0, 0) for size in range(max_size + 1)]
+                       for state in STATES], dtype=np.float64)
+    streams = np.random.SeedSequence(seed).spawn((rows + chunk_rows - 1) // chunk_rows)
+    for i, stream in enumerate(streams):
+        population_stream, nudge_stream = stream.spawn(2)
+        batch = generate(min(chunk_rows, rows - i * chunk_rows), population_stream, FUZZ_POPULATION)
+        rng = np.random.default_rng(nudge_stream)
+        state = batch.state.astype(np.intp)
+        for column, name in enumerate(("income", "assets")):
+            nudge = rng.random(len(batch)) < 0.5
+            values = getattr(batch, name)
+            values[nudge] = limits[state[nudge], batch.household_size[nudge], column] + rng.choice(
+                LIMIT_OFFSETS, int(nudge.sum()))
+        yield batch
+
+
+def complexity(row):
+    """Ordering for shrinking: fewer unusual answers, then smaller households, earlier states and rounder amounts."""
+    state, household_size, income, assets = row[0], row[4], row[6], row[7]
+    unusual = sum(row[FIELDS.index(name)] != default for name, default in FLAG_DEFAULTS.items())
+    return (unusual, household_size, STATES.index(state), income != int(income), abs(income),
+            assets != int(assets), abs(assets))
+
+
+def candidates(row):
+    """Simpler variants of ``row`` to try while shrinking."""
+    answers = dict(zip(FIELDS, row))
+    for name, default in FLAG_DEFAULTS.items():
+        yield {**answers, name: default}
+    household_size = answers["household_size"]
+    for size in (1, 2, 3, household_size // 2, household_size - 1):
+        if size >= 1:
+            yield {**answers, "household_size": size}
+    for state in STATES[:STATES.index(answers["state"])]:
+        yield {**answers, "state": state}
+    income_limit, asset_limit = reference_limits(answers["state"], household_size)
+    for name, value, limit in (("income", answers["income"], income_limit), ("assets", answers["assets"], asset_limit)):
+        for simpler in (0, math.floor(value), math.ceil(value), limit - 1, limit, limit + 1):
+            yield {**answers, name: float(simpler)}
+
+
+def shrink(row, diverges, max_steps=500):
+    """Greedily simplify ``row`` while ``diverges(row)`` still holds."""
+    for _ in range(max_steps):
+        for answers in candidates(row):
+            simpler = tuple(answers[name] for name in FIELDS)
+            if complexity(simpler) < complexity(row) and diverges(simpler):
+                row = simpler
+                break
+        else:
+            break
+    return row
+
+
+def describe(row):
+    answers = dict(zip(FIELDS, row))
+    return "Applicant(" + ", ".join(f"{name}={value!r}" for name, value in answers.items()) + ")"
+
+
+def report(name, row, run, rules):
+    expected = oracle(row)
+    actual = run(batch_of([row]), [row], rules)[0]
+    print(f"  {describe(row)}")
+    if isinstance(actual, str):
+        print(f"    rejected: {actual}")
+        actual = (None,) * len(OUTCOME_FIELDS)
+    for field in differences(expected, actual):
+        index = OUTCOME_FIELDS.index(field)
+        print(f"    {field}:\n      reference {expected[index]!r}\n      {name:<9} {actual[index]!r}")
+    print(f"  rerun: python -m tools.check_equivalence --engine {name} --case '{json.dumps(dict(zip(FIELDS, row)))}'")
+
+
+def check(chunks, runners, rules):
+    """Run every engine over ``(batch, rows)`` chunks; the case count and
+    each engine's divergence count and first divergent row."""
+    cases = 0
+    failures = {name: [0, None] for name in runners}
+    for batch, rows in chunks:
+        expected = [oracle(row) for row in rows]
+        cases += len(rows)
+        for name, run in runners.items():
+            for row, want, got in zip(rows, expected, run(batch, rows, rules)):
+                if got is not None and got != want and differences(want, got):
+                    failures[name][0] += 1
+                    if failures[name][1] is None:
+                        failures[name][1] = row
+    return cases, failures
+
+
+def reject_assess(answers, rules):
+    assess(Applicant(**answers), rules)
+
+
+def reject_cached(answers, rules):
+    cached_assess(Applicant(**answers))
+
+
+def reject_bulk(answers, rules):
+    assess_batch(batch_from_columns({name: [value] for name, value in answers.items()}), rules)
+
+
+def reject_static(answers, rules):
+    """What a visitor gets from the pre-rendered pages: there is no page for
+    answers outside the built grid, and the page script refuses amounts that
+    are missing, negative or not finite (as parsed from the query string)."""
+    for name in ("state", *FLAG_DEFAULTS, "household_size"):
+        value = answers[name]
+        if name == "state":
+            valid = value in STATES
+        elif name == "household_size":
+            valid = isinstance(value, (int, float)) and 1 <= value <= TABLE_HOUSEHOLD_SIZE and value == int(value)
+        else:
+            valid = value in (True, False)
+        if not valid:
+            raise ValueError(f"Invalid {name}: no page for {value!r}")
+    for name in ("income", "assets"):
+        try:
+            amount = float(answers[name])
+        except (TypeError, ValueError):
+            amount = math.nan
+        if not 0 <= amount < math.inf:
+            raise ValueError(f"Invalid {name}: the page asks for an amount of $0 or more")
+
+
+def reject_api(answers, rules):
+    from api import applicant_from_json  # needs the web dependencies, so only when checked
+
+    cached_assess(applicant_from_json(answers))
+
+
+def _one_at_a_time(reject):
+    def run(cases, rules):
+        messages = []
+        for answers in cases:
+            try:
+                reject(answers, rules)
+            except ValueError as exc:
+                messages.append(str(exc))
+            else:
+                messages.append(None)
+        return messages
+
+    return run
+
+
+def _js_value(value):
+    if isinstance(value, float) and not math.isfinite(value):
+        return {"$number": str(value).replace("inf", "Infinity").replace("nan", "NaN")}
+    return value
+
+
+def rejecters(runners):
+    """Per engine, a function from malformed cases to error messages (``None`` where one was accepted)."""
+    checks = {"assess": reject_assess, "cached": reject_cached, "bulk": reject_bulk, "static": reject_static,
+              "api": reject_api}
+    result = {name: _one_at_a_time(check) for name, check in checks.items() if name in runners}
+    if "client" in runners:
+        def run_client(cases, rules):
+            rows = [[_js_value(answers[name]) for name in FIELDS] for answers in cases]
+            return [outcome if isinstance(outcome, str) else None for outcome in runners["client"](None, rows, rules)]
+
+        result["client"] = run_client
+    return result
+
+
+def malformed_cases():
+    for field, values in MALFORMED.items():
+        for value in values:
+            yield field, value, {**VALID_ANSWERS, field: value}
+
+
+def check_malformed(runners, rules):
+    """Failures where an engine accepts a malformed case, or rejects it without naming the bad field."""
+    cases = list(malformed_cases())
+    failures = []
+    for name, run in rejecters(runners).items():
+        for (field, value, _), message in zip(cases, run([answers for _, _, answers in cases], rules)):
+            if message is None:
+                failures.append(f"{name} assesses {field}={value!r} instead of rejecting it")
+            elif field not in message:
+                failures.append(f"{name} rejects {field}={value!r} without naming the field: {message}")
+    return len(cases), failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", type=int, default=500_000,
+                        help="random cases after the boundary grid (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--engine", action="append", choices=ENGINES, help="repeatable (default: all)")
+    parser.add_argument("--case", help="check one case, as a JSON object of form answers")
+    args = parser.parse_args(argv)
+
+    rules = get_rules()
+    with tempfile.TemporaryDirectory() as tmp:
+        runners = engine_runners(rules, tmp)
+        if "client" not in runners:
+            print("node not found; skipping the client engine")
+        runners = {name: run for name, run in runners.items() if not args.engine or name in args.engine}
+
+        if args.case:
+            answers = json.loads(args.case)
+            try:
+                row = rows_of(batch_from_columns({name: [value] for name, value in answers.items()}))[0]
+            except ValueError as exc:
+                parser.error(str(exc))
+            diverged = False
+            for name, run in runners.items():
+                if differences(oracle(row), run(batch_of([row]), [row], rules)[0]):
+                    diverged = True
+                    print(f"{name} diverges from the reference:")
+                    report(name, row, run, rules)
+                else:
+                    print(f"{name} agrees with the reference")
+            return 1 if diverged else 0
+
+        start = time.perf_counter()
+        grid = list(boundary_rows())
+        # The grid keeps its own rows so the Python engines see its 2.0 sizes as given
+        chunks = itertools.chain([(batch_of(grid), grid)],
+                                 ((batch, rows_of(batch)) for batch in random_batches(args.cases, args.seed)))
+        cases, failures = check(chunks, runners, rules)
+        elapsed = time.perf_counter() - start
+
+        print(f"rules {rules.version}: {cases:,} cases ({len(grid):,} boundary, {args.cases:,} random, "
+              f"seed {args.seed}) in {elapsed:.1f}s")
+        for name, (count, first) in failures.items():
+            if not count:
+                print(f"{name}: no divergence")
+                continue
+            print(f"{name}: {count:,} divergent cases; minimal reproducer:")
+            run = runners[name]
+            minimal = shrink(first, lambda row: bool(differences(oracle(row), run(batch_of([row]), [row], rules)[0])))
+            report(name, minimal, run, rules)
+
+        if not args.engine and importlib.util.find_spec("starlette"):
+            runners["api"] = None  # request parsing, checked on malformed answers only
+        malformed, rejections = check_malformed(runners, rules)
+        print(f"malformed answers: {malformed} cases, {len(rejections)} not rejected as expected")
+        for failure in rejections:
+            print(f"  {failure}")
+    return 1 if rejections or any(count for count, _ in failures.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
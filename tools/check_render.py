@@ -0,0 +1,67 @@
+"""Regression check: one rerun of the quiz renders the page exactly once.
+
+Streamlit re-executes ``housing_quiz.py`` on every interaction, so any
+duplicated block multiplies server CPU and websocket traffic on every
+click. This drives the app through ``AppTest`` and compares the number of
+elements emitted per rerun against a fixed budget.
+
+    python -m tools.check_render
+"""
+
+import sys
+from collections import Counter
+
+from streamlit.testing.v1 import AppTest
+
+APP = "../housing_quiz.py"  # resolved relative to this file by AppTest
+
+# Element counts per rerun. Raise these deliberately when the page grows.
+BUDGET_INITIAL = {"title": 1, "form": 1, "selectbox": 1, "radio": 5, "number_input": 3, "checkbox": 1, "total": 19}
+BUDGET_SUBMITTED = {"title": 1, "form": 1, "subheader": 2, "expander": 1, "vega_lite_chart": 1, "total": 38}
+
+
+def walk(node):
+    yield node
+    for child in getattr(node, "children", {}).values():
+        yield from walk(child)
+
+
+def count_elements(at):
+    counts = Counter(node.type for node in walk(at.main) if node is not at.main)
+    counts["total"] = sum(counts.values())
+    return counts
+
+
+def check(counts, budget, label):
+    failures = []
+    for key, expected in budget.items():
+        if key == "total":
+            if counts[key] > expected:
+                failures.append(f"{label}: {counts[key]} elements emitted, budget is {expected}")
+        elif counts[key] != expected:
+            failures.append(f"{label}: expected {expected} {key}, got {counts[key]}")
+    return failures
+
+
+def main():
+    at = AppTest.from_file(APP).run()
+    if at.exception:
+        print(f"{APP} raised: {at.exception}")
+        return 1
+    initial = count_elements(at)
+
+    at.button[0].click().run()
+    if at.exception:
+        print(f"{APP} raised on submit: {at.exception}")
+        return 1
+    submitted = count_elements(at)
+
+    failures = check(initial, BUDGET_INITIAL, "initial") + check(submitted, BUDGET_SUBMITTED, "submitted")
+    print(f"initial rerun: {initial['total']} elements, submitted rerun: {submitted['total']} elements")
+    for failure in failures:
+        print(failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""Regression check: reports over a log directory holding both file formats.
+
+A deployment that changes ``HOUSING_QUIZ_SUBMISSION_LOG_FORMAT`` ends up
+with Parquet and Arrow IPC files side by side. This logs the same
+synthetic assessments in both formats into one directory and checks that
+``report.build_report`` counts each row twice, with and without filters.
+
+    python -m tools.check_report [--rows 20000]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+from bulk import assess_batch
+from eligibility import STATES
+from population import generate
+from report import build_report
+from submission_log import FORMATS, TIME_BUCKET, SubmissionLog
+
+
+def expected_rows(batch, result, copies, max_household_size, states=STATES):
+    submissions, eligible = Counter(), Counter()
+    for state, size, ok in zip(batch.state.tolist(), batch.household_size.tolist(), result.eligible.tolist()):
+        if STATES[state] in states:
+            group = (STATES[state], min(size, max_household_size))
+            submissions[group] += copies
+            eligible[group] += copies * ok
+    return {group: (count, round(eligible[group] / count, 4)) for group, count in submissions.items()}
+
+
+def report_rows(rows):
+    return {(row["state"], int(row["household_size"].rstrip("+"))): (row["submissions"], row["eligible_rate"])
+            for row in rows}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    args = parser.parse_args(argv)
+
+    batch = generate(args.rows)
+    result = assess_batch(batch)
+    hour = datetime.fromtimestamp(time.time() // TIME_BUCKET * TIME_BUCKET, timezone.utc).isoformat()
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in FORMATS:
+            log = SubmissionLog(tmp, fmt, flush_interval=3600)
+            log.record_batch(batch, result)
+            log.close()
+        cases = {
+            "all files": ({}, STATES),
+            f"--since {hour}": ({"since": hour}, STATES),
+            "--state NSW --state QLD": ({"states": ["NSW", "QLD"]}, ("NSW", "QLD")),
+        }
+        for label, (filters, states) in cases.items():
+            try:
+                got = report_rows(build_report(tmp, 6, **filters))
+            except Exception as exc:
+                failures.append(f"{label}: {type(exc).__name__}: {exc}")
+                continue
+            if got != expected_rows(batch, result, len(FORMATS), 6, states):
+                failures.append(f"{label}: report does not match the logged rows")
+
+    for failure in failures:
+        print(failure)
+    print(f"{args.rows} rows logged as {' and '.join(FORMATS)}: {len(failures)} failure(s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+"""Load test: concurrent sessions filling in and submitting the quiz on one server.
+
+Starts a single headless ``streamlit run housing_quiz.py`` and opens
+``--sessions`` websocket sessions against it at once, each speaking the
+protocol a browser tab does (see ``tools.bench_startup``). A session loads
+the page, then fills in and submits ``quiz_form`` several times with
+answers drawn from the default synthetic population (see ``population``).
+All sessions share the server's process, GIL, ``cache_resource``, rules
+and assessment cache, as real visitors do.
+
+The report (rerun latency percentiles, ForwardMsg bytes per rerun, server
+CPU per rerun and server RSS per open session) is written as JSON so runs
+can be diffed between commits. Server CPU and RSS are read from ``/proc``
+and are ``null`` elsewhere.
+
+    python -m tools.loadtest --sessions 20 --submits 5 -o loadtest.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from websockets.sync.client import connect
+
+from eligibility import FLAG_FIELDS, STATES
+from population import generate
+from tools.bench_startup import APP, free_port, wait_healthy
+
+# Widgets in page order within each element type, as the quiz renders them
+WIDGETS = {
+    "selectbox": ("state",),
+    "radio": ("citizenship", "state_resident", "owns_property", "has_independent_income", "priority"),
+    "number_input": ("household_size", "income", "assets"),
+    "button": ("submit",),
+}
+TIMEOUT = 60
+
+
+def server_cpu_seconds(pid):
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+    except OSError:
+        return None
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")  # utime + stime
+
+
+def server_rss_bytes(pid):
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return None
+
+
+def form_answers(batch, i):
+    """Row ``i`` of a generated population as quiz widget values."""
+    yes_no = lambda flag: "Yes" if flag else "No"  # noqa: E731
+    answers = {name: yes_no(getattr(batch, name)[i]) for name in FLAG_FIELDS}
+    answers.update(state=STATES[batch.state[i]], household_size=int(batch.household_size[i]),
+                   income=float(batch.income[i]), assets=float(batch.assets[i]))
+    return answers
+
+
+def open_stream(port):
+    return connect(f"ws://127.0.0.1:{port}/_stcore/stream", subprotocols=["streamlit"], max_size=None)
+
+
+class Session:
+    """One browser tab's session with the quiz, over an open websocket."""
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.widgets = {}  # name -> (widget id, fragment id)
+        self.errors = []
+
+    def rerun(self, widget_states=(), fragment_id=""):
+        """Send one rerun and wait for it to finish; returns ``(seconds, bytes received)``."""
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_script_hash = ""
+        msg.rerun_script.fragment_id = fragment_id
+        msg.rerun_script.widget_states.widgets.extend(widget_states)
+        start = time.perf_counter()
+        self.ws.send(msg.SerializeToString())
+        received = 0
+        seen = {kind: 0 for kind in WIDGETS}
+        while True:
+            data = self.ws.recv(timeout=TIMEOUT)
+            received += len(data)
+            forward = ForwardMsg()
+            forward.ParseFromString(data)
+            kind = forward.WhichOneof("type")
+            if kind == "script_finished":
+                return time.perf_counter() - start, received
+            if kind != "delta" or forward.delta.WhichOneof("type") != "new_element":
+                continue
+            element = forward.delta.new_element
+            element_type = element.WhichOneof("type")
+            if element_type == "exception":
+                self.errors.append(element.exception.message)
+            elif element_type in WIDGETS and seen[element_type] < len(WIDGETS[element_type]):
+                # Only the quiz's own widgets; the what-if panel's come after them
+                name = WIDGETS[element_type][seen[element_type]]
+                self.widgets.setdefault(name, (getattr(element, element_type).id, forward.delta.fragment_id))
+                seen[element_type] += 1
+
+    def submit(self, answers):
+        """Fill in every question and press submit, as the browser sends it."""
+        states = [WidgetState(id=self.widgets[name][0], **{
+            "double_value" if name in WIDGETS["number_input"] else "string_value": value
+        }) for name, value in answers.items()]
+        button_id, fragment_id = self.widgets["submit"]
+        states.append(WidgetState(id=button_id, trigger_value=True))
+        return self.rerun(states, fragment_id)
+
+
+def run_session(port, seed, submits, start_barrier, done_barrier, results):
+    """One simulated visitor; appends its measurements to ``results``."""
+    batch = generate(submits, seed)  # default population: the shape of real traffic
+    reruns = []  # (kind, seconds, bytes)
+    error = None
+    with contextlib.ExitStack() as stack:
+        try:
+            session = Session(stack.enter_context(open_stream(port)))
+            start_barrier.wait()
+            reruns.append(("load", *session.rerun()))
+            for i in range(submits):
+                reruns.append(("submit", *session.submit(form_answers(batch, i))))
+            if session.errors:
+                raise RuntimeError(session.errors[0])
+        except Exception as exc:  # reported in the summary, not fatal
+            error = repr(exc)
+            start_barrier.abort()  # a session that failed to connect must not hang the rest
+        results.append({"reruns": reruns, "error": error})
+        done_barrier.wait()  # stay connected until the server's RSS is read
+
+
+def percentiles(values):
+    ordered = sorted(values)
+    pick = lambda q: ordered[min(int(q * len(ordered)), len(ordered) - 1)]  # noqa: E731
+    return {"p50": pick(0.50), "p90": pick(0.90), "p99": pick(0.99), "max": ordered[-1]}
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_test(port, pid, args):
+    # One visitor first, so imports and process-wide caches are not billed
+    # to the measured sessions
+    with open_stream(port) as ws:
+        warm = Session(ws)
+        warm.rerun()
+        warm.submit(form_answers(generate(1, args.seed), 0))
+
+    marks = {"start": time.perf_counter(), "rss": server_rss_bytes(pid), "cpu": server_cpu_seconds(pid)}
+
+    def finished():
+        # Run by the last session to finish, before any of them disconnects
+        marks.update(end=time.perf_counter(), rss_after=server_rss_bytes(pid), cpu_after=server_cpu_seconds(pid))
+
+    start_barrier = threading.Barrier(args.sessions, action=lambda: marks.update(start=time.perf_counter()))
+    done_barrier = threading.Barrier(args.sessions, action=finished)
+    results = []
+    threads = [
+        threading.Thread(target=run_session,
+                         args=(port, args.seed + 1 + i, args.submits, start_barrier, done_barrier, results))
+        for i in range(args.sessions)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = marks["end"] - marks["start"]
+
+    reruns = [rerun for session in results for rerun in session["reruns"]]
+    report = {
+        "revision": git_revision(),
+        "sessions": args.sessions,
+        "submits_per_session": args.submits,
+        "reruns": len(reruns),
+        "errors": [session["error"] for session in results if session["error"]],
+        "wall_seconds": round(elapsed, 3),
+        "reruns_per_second": round(len(reruns) / elapsed, 1),
+        "server_cpu_ms_per_rerun": (round((marks["cpu_after"] - marks["cpu"]) / max(len(reruns), 1) * 1000, 2)
+                                    if marks["cpu"] is not None else None),
+        "server_rss_kb_per_session": (round((marks["rss_after"] - marks["rss"]) / args.sessions / 1024)
+                                      if marks["rss"] is not None else None),
+    }
+    for kind in ("load", "submit"):
+        timings = [seconds for rerun_kind, seconds, _ in reruns if rerun_kind == kind]
+        sizes = [size for rerun_kind, _, size in reruns if rerun_kind == kind]
+        if timings:
+            report[f"{kind}_latency_ms"] = {k: round(v * 1000, 2) for k, v in percentiles(timings).items()}
+            report[f"{kind}_delta_bytes_mean"] = round(statistics.mean(sizes))
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20, help="concurrent sessions")
+    parser.add_argument("--submits", type=int, default=5, help="form submissions per session")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", default="loadtest.json", help="JSON report path")
+    args = parser.parse_args(argv)
+
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", APP, "--server.headless", "true",
+         "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_healthy(port, server)
+        report = load_test(port, server.pid, args)
+    finally:
+        server.terminate()
+        server.wait()
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())